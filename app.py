@@ -1,7 +1,8 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-from datetime import datetime, date, timedelta
+import pyarrow as pa
+from datetime import datetime, date, time, timedelta
 import calendar
 import plotly.express as px
 import plotly.graph_objects as go
@@ -21,9 +22,14 @@ from email.mime.base import MIMEBase
 from email import encoders
 import os
 import io
+import zipfile
 import hashlib
 import json
-import time
+import threading
+from functools import lru_cache
+from bisect import bisect_left
+from itertools import accumulate
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dateutil.relativedelta import relativedelta
 
 # 페이지 설정
@@ -44,12 +50,35 @@ INSURANCE_RATES = {
     "workers_compensation": 0.007,  # 산재보험 평균 0.7%
 }
 
+# 국민연금, 건강보험, 고용보험 요율 벡터 (기준금액 벡터와 한 번에 곱하기 위함)
+INSURANCE_RATE_VEC = np.array([
+    INSURANCE_RATES['national_pension'],
+    INSURANCE_RATES['health_insurance'],
+    INSURANCE_RATES['employment_insurance']
+])
+
 # 국민연금 기준소득월액
 PENSION_LIMITS = {
     "min": 400000,  # 최저 40만원
     "max": 6370000  # 최고 637만원
 }
 
+# 기본 수당 설정 (수당을 따로 지정하지 않은 경우)
+DEFAULT_ALLOWANCES = {
+    'performance_bonus': 0,
+    'attendance_allowance': 0,
+    'meal_allowance': 130000,  # 기본 식대
+    'holiday_allowance': 0,
+    'position_allowance': 0,
+    'special_duty_allowance': 0,
+    'overtime_allowance': 0,
+    'skill_allowance': 0,
+    'annual_leave_allowance': 0,
+    'other_allowance': 0
+}
+# 급여 테이블에 저장되는 수당 항목 (순서 유지)
+ALLOWANCE_KEYS = tuple(DEFAULT_ALLOWANCES)
+
 # ============================================
 # 올바른 2025년 소득세 및 지방소득세 계산 (test9.py 기반)
 # ============================================
@@ -96,35 +125,47 @@ def calculate_correct_annual_taxable_income(monthly_salary, family_count):
         'taxable_income': taxable_income
     }
 
+# 2025년 소득세 누진세율 구간
+INCOME_TAX_BRACKETS = [
+    (14000000, 0.06),      # 1,400만원 이하 6%
+    (50000000, 0.15),      # 1,400만원 초과 ~ 5,000만원 이하 15%
+    (88000000, 0.24),      # 5,000만원 초과 ~ 8,800만원 이하 24%
+    (150000000, 0.35),     # 8,800만원 초과 ~ 1억5,000만원 이하 35%
+    (300000000, 0.38),     # 1억5,000만원 초과 ~ 3억원 이하 38%
+    (500000000, 0.40),     # 3억원 초과 ~ 5억원 이하 40%
+    (1000000000, 0.42),    # 5억원 초과 ~ 10억원 이하 42%
+    (float('inf'), 0.45)   # 10억원 초과 45%
+]
+
+# 구간 조회용 표 (구간 상한, 구간 하한, 세율, 하한까지의 누적 세액)
+INCOME_TAX_BRACKET_LIMITS = [limit for limit, _ in INCOME_TAX_BRACKETS]
+INCOME_TAX_BRACKET_FLOORS = [0] + INCOME_TAX_BRACKET_LIMITS[:-1]
+INCOME_TAX_BRACKET_RATES = [rate for _, rate in INCOME_TAX_BRACKETS]
+INCOME_TAX_BRACKET_BASE_TAX = list(accumulate(
+    ((limit - floor) * rate for limit, floor, rate in zip(INCOME_TAX_BRACKET_LIMITS[:-1], INCOME_TAX_BRACKET_FLOORS, INCOME_TAX_BRACKET_RATES)),
+    initial=0
+))
+
+INCOME_TAX_LIMITS_ARR = np.array(INCOME_TAX_BRACKET_LIMITS)
+INCOME_TAX_FLOORS_ARR = np.array(INCOME_TAX_BRACKET_FLOORS, dtype=np.float64)
+INCOME_TAX_RATES_ARR = np.array(INCOME_TAX_BRACKET_RATES)
+INCOME_TAX_BASE_TAX_ARR = np.array(INCOME_TAX_BRACKET_BASE_TAX)
+
 def calculate_correct_progressive_income_tax(taxable_income):
     """올바른 소득세 계산 (2025년 세율)"""
     if taxable_income <= 0:
         return 0
     
-    # 2025년 소득세 누진세율 구간
-    tax_brackets = [
-        (14000000, 0.06),      # 1,400만원 이하 6%
-        (50000000, 0.15),      # 1,400만원 초과 ~ 5,000만원 이하 15%
-        (88000000, 0.24),      # 5,000만원 초과 ~ 8,800만원 이하 24%
-        (150000000, 0.35),     # 8,800만원 초과 ~ 1억5,000만원 이하 35%
-        (300000000, 0.38),     # 1억5,000만원 초과 ~ 3억원 이하 38%
-        (500000000, 0.40),     # 3억원 초과 ~ 5억원 이하 40%
-        (1000000000, 0.42),    # 5억원 초과 ~ 10억원 이하 42%
-        (float('inf'), 0.45)   # 10억원 초과 45%
-    ]
-    
-    total_tax = 0
-    prev_limit = 0
-    
-    for limit, rate in tax_brackets:
-        if taxable_income <= limit:
-            total_tax += (taxable_income - prev_limit) * rate
-            break
-        else:
-            total_tax += (limit - prev_limit) * rate
-            prev_limit = limit
-    
-    return total_tax
+    # 과세표준이 속한 구간 (상한 이하인 첫 구간)
+    idx = bisect_left(INCOME_TAX_BRACKET_LIMITS, taxable_income)
+    return INCOME_TAX_BRACKET_BASE_TAX[idx] + (taxable_income - INCOME_TAX_BRACKET_FLOORS[idx]) * INCOME_TAX_BRACKET_RATES[idx]
+
+def calculate_progressive_income_tax_vec(taxable_income):
+    """소득세 계산 (배열 입력, 구간 표를 searchsorted로 조회)"""
+    taxable_income = np.asarray(taxable_income)
+    idx = np.searchsorted(INCOME_TAX_LIMITS_ARR, taxable_income, side='left')
+    tax = INCOME_TAX_BASE_TAX_ARR[idx] + (taxable_income - INCOME_TAX_FLOORS_ARR[idx]) * INCOME_TAX_RATES_ARR[idx]
+    return np.where(taxable_income <= 0, 0.0, tax)
 
 def calculate_child_tax_credit(family_count):
     """자녀세액공제 계산 (자녀 1명당 연 15만원)"""
@@ -164,6 +205,55 @@ def calculate_correct_taxes_for_payroll(monthly_salary, family_count):
         'annual_income_tax_after_credit': annual_income_tax
     }
 
+def calculate_correct_taxes_vec(monthly_salary, family_count):
+    """급여 계산용 세금 계산 (배열 입력, 여러 직원을 한 번에 계산)"""
+    monthly_salary = np.asarray(monthly_salary, dtype=np.int64)
+    family_count = np.asarray(family_count, dtype=np.int64)
+    
+    # 1. 과세표준 계산 (급여소득공제 + 인적공제)
+    annual_gross_salary = monthly_salary * 12
+    salary_income_deduction = np.select(
+        [annual_gross_salary <= 5000000, annual_gross_salary <= 15000000,
+         annual_gross_salary <= 45000000, annual_gross_salary <= 100000000],
+        [annual_gross_salary * 0.7,
+         3500000 + (annual_gross_salary - 5000000) * 0.4,
+         7500000 + (annual_gross_salary - 15000000) * 0.15,
+         12000000 + (annual_gross_salary - 45000000) * 0.05],
+        default=14750000 + (annual_gross_salary - 100000000) * 0.02
+    ).astype(np.int64)
+    personal_deductions = family_count * 1500000
+    taxable_income = np.maximum(0, annual_gross_salary - salary_income_deduction - personal_deductions)
+    
+    # 2. 소득세 산출 (구간별 누적 세액 + 해당 구간 초과분 × 세율)
+    annual_income_tax_gross = calculate_progressive_income_tax_vec(taxable_income)
+    
+    # 3. 자녀세액공제 적용
+    child_tax_credit = np.maximum(0, family_count - 1) * 150000
+    annual_income_tax = np.maximum(0, annual_income_tax_gross - child_tax_credit)
+    
+    # 4. 지방소득세 계산 (소득세의 10%)
+    annual_local_tax = (annual_income_tax * 0.1).astype(np.int64)
+    
+    # 5. 월액으로 환산
+    monthly_income_tax = (annual_income_tax / 12).astype(np.int64)
+    monthly_local_tax = (annual_local_tax / 12).astype(np.int64)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        effective_rate = np.where(monthly_salary > 0, (monthly_income_tax + monthly_local_tax) / monthly_salary * 100, 0.0)
+    
+    return {
+        'income_tax': monthly_income_tax,
+        'resident_tax': monthly_local_tax,
+        'local_tax': monthly_local_tax,
+        'taxable_income': taxable_income,
+        'effective_rate': effective_rate,
+        'salary_income_deduction': salary_income_deduction,
+        'personal_deductions': personal_deductions,
+        'child_tax_credit': child_tax_credit,
+        'annual_income_tax_before_credit': annual_income_tax_gross,
+        'annual_income_tax_after_credit': annual_income_tax
+    }
+
 # 기존 함수명 호환성을 위한 wrapper
 def get_income_tax(monthly_salary, family_count):
     """기존 함수명 호환성"""
@@ -179,25 +269,32 @@ def calculate_resident_tax(monthly_salary, family_count):
 # 한글 폰트 및 PDF 관련 함수
 # ============================================
 
+# 한글 폰트 후보 경로
+KOREAN_FONT_PATHS = (
+    "/System/Library/Fonts/AppleSDGothicNeo.ttc",  # macOS
+    "/System/Library/Fonts/NanumGothic.ttc",  # macOS
+    "C:/Windows/Fonts/malgun.ttf",  # Windows 맑은고딕
+    "C:/Windows/Fonts/NanumGothic.ttf",  # Windows 나눔고딕
+    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",  # Linux
+)
+KOREAN_FONT_NAME = 'NanumGothic'
+
+# Streamlit은 재실행마다 스크립트를 새로 실행하므로 모듈 변수 대신 cache_resource로 프로세스당 1회만 설정
 @st.cache_resource
 def setup_korean_font():
     """한글 폰트 설정"""
+    # 폰트 등록 정보는 reportlab 프로세스 전역에 남으므로, 이미 등록되어 있으면 경로 탐색과 TTF 파싱을 생략
+    if KOREAN_FONT_NAME in pdfmetrics.getRegisteredFontNames():
+        return KOREAN_FONT_NAME
+
     try:
-        korean_fonts = [
-            "/System/Library/Fonts/AppleSDGothicNeo.ttc",  # macOS
-            "/System/Library/Fonts/NanumGothic.ttc",  # macOS
-            "C:/Windows/Fonts/malgun.ttf",  # Windows 맑은고딕
-            "C:/Windows/Fonts/NanumGothic.ttf",  # Windows 나눔고딕
-            "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",  # Linux
-        ]
-        
-        for font_path in korean_fonts:
-            if os.path.exists(font_path):
-                try:
-                    pdfmetrics.registerFont(TTFont('NanumGothic', font_path))
-                    return 'NanumGothic'
-                except:
-                    continue
+        # 실제로 존재하는 폰트 경로만 확인 (캐시된 함수 안에서만 실행되어 PDF를 만들지 않는 화면에는 비용 없음)
+        for font_path in (path for path in KOREAN_FONT_PATHS if os.path.exists(path)):
+            try:
+                pdfmetrics.registerFont(TTFont(KOREAN_FONT_NAME, font_path))
+                return KOREAN_FONT_NAME
+            except:
+                continue
         
         return 'Helvetica'
     
@@ -209,6 +306,14 @@ def setup_korean_font():
 # Supabase 연결 및 데이터베이스 함수들
 # ============================================
 
+# PostgREST/PostgreSQL 오류 코드 (선택 설치 DB 함수/뷰가 없을 때만 기존 방식으로 대체)
+MISSING_FUNCTION_ERROR_CODES = ('PGRST202', '42883')
+MISSING_RELATION_ERROR_CODES = ('PGRST205', '42P01')
+
+def is_postgrest_error(error, codes):
+    """PostgREST 오류 코드가 지정된 코드 중 하나인지 확인 (DB 함수/뷰 미설치 판별용)"""
+    return getattr(error, 'code', None) in codes
+
 @st.cache_resource
 def init_supabase():
     """Supabase 클라이언트 초기화"""
@@ -247,23 +352,20 @@ def init_supabase():
 # 근무일수 및 급여 차감 계산 함수들
 # ============================================
 
+# 연/월을 알 수 없을 때 사용하는 월 근무일수
+DEFAULT_MONTHLY_WORKDAYS = 22
+
+@lru_cache(maxsize=256)
 def get_workdays_in_month(year, month):
     """해당 월의 근무일수 계산 (주말 제외, 평일만)"""
-    try:
-        first_day = datetime(year, month, 1).date()
-        last_day = (datetime(year, month + 1, 1) - timedelta(days=1)).date() if month < 12 else datetime(year, 12, 31).date()
-        
-        workdays = 0
-        current_date = first_day
-        
-        while current_date <= last_day:
-            if current_date.weekday() < 5:  # 월요일(0) ~ 금요일(4)
-                workdays += 1
-            current_date += timedelta(days=1)
-        
-        return workdays
-    except Exception as e:
-        return 22
+    # 예외 처리 대신 입력 범위를 먼저 확인 (잘못된 연/월은 기본 근무일수 사용)
+    if not (1 <= year <= 9999 and 1 <= month <= 12):
+        return DEFAULT_MONTHLY_WORKDAYS
+    
+    first_day = np.datetime64(f'{year:04d}-{month:02d}-01')
+    next_month_first_day = (np.datetime64(first_day, 'M') + 1).astype('datetime64[D]')
+    # 월요일 ~ 금요일 개수 (종료일 미포함)
+    return int(np.busday_count(first_day, next_month_first_day))
 
 def calculate_unpaid_leave_deduction(base_salary, unpaid_days, year, month):
     """무급휴가에 따른 급여 차감 계산"""
@@ -294,17 +396,53 @@ def calculate_lateness_deduction(base_salary, late_hours, year, month):
     except Exception as e:
         return 0
 
+# 근무 기준 시각 (출근 09:00, 퇴근 18:00) - 지각 판정은 자정 기준 분 단위 정수로 비교
+STANDARD_CLOCK_IN = time(9, 0)
+STANDARD_CLOCK_OUT = time(18, 0)
+STANDARD_START_MINUTES = STANDARD_CLOCK_IN.hour * 60 + STANDARD_CLOCK_IN.minute
+LATENESS_THRESHOLD_MINUTES = 30
+
+def parse_clock_minutes(times):
+    """HH:MM:SS 시각 컬럼을 자정 기준 분(float)으로 일괄 변환 (형식이 다르면 NaN)"""
+    times = times.astype(str)
+    return pd.to_numeric(times.str[:2], errors='coerce') * 60 + pd.to_numeric(times.str[3:5], errors='coerce')
+
+def calculate_attendance_late_hours(attendance_df):
+    """근태 기록별 지각/조퇴 차감 시간 계산 (행 단위 반복 없이 컬럼 연산으로 처리)"""
+    late_hours = pd.Series(0.0, index=attendance_df.index)
+    if 'status' not in attendance_df.columns or 'actual_hours' not in attendance_df.columns:
+        return late_hours
+
+    status = attendance_df['status']
+
+    if 'clock_in' in attendance_df.columns:
+        # 09:00 기준 지각 분 계산, 30분 이상 지각만 차감 대상 (get_attendance에서 변환해 둔 분 컬럼 우선 사용)
+        if 'clock_in_minutes' in attendance_df.columns:
+            clock_in_minutes = attendance_df['clock_in_minutes']
+        else:
+            clock_in_minutes = parse_clock_minutes(attendance_df['clock_in'])
+        late_minutes = (clock_in_minutes - STANDARD_START_MINUTES).clip(lower=0)
+        late_mask = status.eq('지각') & (late_minutes >= LATENESS_THRESHOLD_MINUTES)
+        late_hours = late_hours.mask(late_mask, late_minutes / 60)
+
+    # 조퇴: 8시간 미만 근무한 시간만큼 차감
+    actual_hours = attendance_df['actual_hours']
+    early_leave_mask = status.eq('조퇴') & (actual_hours < 8)
+    late_hours = late_hours.mask(early_leave_mask, 8 - actual_hours)
+
+    return late_hours
+
 def get_employee_deductions(supabase, employee_id, pay_month):
     """해당 직원의 월별 차감 내역 계산"""
     try:
         year, month = map(int, pay_month.split('-'))
-        start_date = datetime(year, month, 1).date()
-        end_date = (datetime(year, month + 1, 1) - timedelta(days=1)).date() if month < 12 else datetime(year, 12, 31).date()
+        period = pd.Period(year=year, month=month, freq='M')
+        start_date, end_date = period.start_time.date(), period.end_time.date()
         
-        # 해당 월 근태 기록 조회
-        attendance_df = get_attendance(supabase, employee_id, start_date, end_date)
+        # 해당 월 근태 기록 조회 (집계만 필요하므로 DataFrame 없이 원본 목록 사용)
+        attendance_rows = get_attendance_raw(supabase, employee_id, start_date, end_date, ('무급휴가', '지각', '조퇴'), ATTENDANCE_DEDUCTION_COLUMNS)
         
-        if attendance_df.empty:
+        if not attendance_rows:
             return {
                 'unpaid_days': 0,
                 'unpaid_deduction': 0,
@@ -314,36 +452,19 @@ def get_employee_deductions(supabase, employee_id, pay_month):
             }
         
         # 무급휴가 일수 계산
-        unpaid_days = len(attendance_df[attendance_df['status'] == '무급휴가'])
-        
-        # 지각/조퇴 시간 계산
-        late_hours = 0
-        if 'status' in attendance_df.columns and 'actual_hours' in attendance_df.columns:
-            late_records = attendance_df[attendance_df['status'] == '지각']
-            for _, record in late_records.iterrows():
-                if 'clock_in' in record and record['clock_in']:
-                    try:
-                        clock_in_time = datetime.strptime(str(record['clock_in']), '%H:%M:%S').time()
-                        standard_time = datetime.strptime('09:00:00', '%H:%M:%S').time()
-                        
-                        if clock_in_time > standard_time:
-                            clock_in_minutes = clock_in_time.hour * 60 + clock_in_time.minute
-                            standard_minutes = standard_time.hour * 60 + standard_time.minute
-                            late_minutes = clock_in_minutes - standard_minutes
-                            
-                            if late_minutes >= 30:
-                                late_hours += late_minutes / 60
-                    except:
-                        continue
-            
-            early_leave_records = attendance_df[attendance_df['status'] == '조퇴']
-            for _, record in early_leave_records.iterrows():
-                if 'actual_hours' in record and record['actual_hours'] < 8:
-                    late_hours += (8 - record['actual_hours'])
-        
+        unpaid_days = sum(1 for row in attendance_rows if row.get('status') == '무급휴가')
+
+        # 지각/조퇴 시간 계산 (해당 기록이 있을 때만 DataFrame 생성)
+        late_rows = [row for row in attendance_rows if row.get('status') in ('지각', '조퇴')]
+        late_hours = 0.0
+        if late_rows:
+            late_df = pd.DataFrame(late_rows)
+            late_df['actual_hours'] = pd.to_numeric(late_df.get('actual_hours'), errors='coerce').fillna(0)
+            late_hours = calculate_attendance_late_hours(late_df).sum()
+
         return {
             'unpaid_days': unpaid_days,
-            'late_hours': round(late_hours, 2),
+            'late_hours': round(float(late_hours), 2),
             'unpaid_deduction': 0,
             'lateness_deduction': 0,
             'total_attendance_deduction': 0
@@ -394,12 +515,79 @@ def update_employee_annual_leave(supabase, employee_id, hire_date):
         }
         
         result = supabase.table('employees').update(update_data).eq('id', employee_id).execute()
+        _fetch_employees_raw.clear()
         return result.data is not None and len(result.data) > 0
         
     except Exception as e:
         st.error(f"연차 업데이트 오류: {str(e)}")
         return False
 
+def calculate_annual_leave_vec(hire_dates, current_date=None):
+    """입사일 배열 기준 연차 일괄 계산 (calculate_annual_leave와 동일 규칙)"""
+    if current_date is None:
+        current_date = datetime.now().date()
+    
+    hire_dates = pd.to_datetime(pd.Series(hire_dates)).reset_index(drop=True)
+    current_ts = pd.Timestamp(current_date)
+    work_years = ((current_ts - hire_dates).dt.days / 365.25).to_numpy()
+    work_months = ((current_ts.year - hire_dates.dt.year) * 12 + (current_ts.month - hire_dates.dt.month)).to_numpy()
+    
+    # 1년 미만: 근무 개월 수, 1년 이상: 15일 + 2년마다 1일 (최대 10일 가산)
+    additional_leave = np.minimum(np.floor_divide(work_years - 1, 2), 10)
+    return np.where(work_years < 1, np.maximum(work_months, 0), 15 + additional_leave).astype(np.int64)
+
+def calculate_leave_usage_rate(used_leave, total_leave):
+    """연차 사용률(%) 계산 (총 연차가 0이면 0%, 차트용 float32)"""
+    used_leave = np.asarray(used_leave, dtype=np.float64)
+    total_leave = np.asarray(total_leave, dtype=np.float64)
+    usage_rate = np.zeros(total_leave.shape, dtype=np.float64)
+    np.divide(used_leave * 100, total_leave, out=usage_rate, where=total_leave > 0)
+    return usage_rate.round(1).astype(np.float32)
+
+def update_employees_annual_leave_bulk(supabase, employees_df):
+    """전체 직원 연차 일괄 업데이트 (DB 함수 한 번의 호출로 기존 직원만 UPDATE)"""
+    try:
+        if supabase is None or employees_df.empty:
+            return False
+        
+        # 입사일을 해석할 수 없는 직원은 개별 업데이트와 마찬가지로 오류를 알리고 제외
+        hire_dates = employees_df['hire_dt'] if 'hire_dt' in employees_df.columns else pd.to_datetime(employees_df['hire_date'], format='%Y-%m-%d', errors='coerce')
+        valid = hire_dates.notna().to_numpy()
+        for name, hire_date in zip(employees_df['name'][~valid], employees_df['hire_date'][~valid]):
+            st.error(f"연차 업데이트 오류: {name}님의 입사일({hire_date})을 확인해주세요.")
+        if not valid.any():
+            return False
+        
+        # 변경할 값(id, 총 연차, 수정 시각)만 전송
+        updated_at = datetime.now().isoformat()
+        rows = pd.DataFrame({
+            'id': employees_df['id'].to_numpy()[valid],
+            'total_annual_leave': calculate_annual_leave_vec(hire_dates[valid]),
+            'updated_at': updated_at
+        }).to_dict('records')
+        
+        try:
+            result = supabase.rpc('employees_update_annual_leave_bulk', {'p_rows': rows}).execute()
+            updated_count = result.data or 0
+        except Exception as e:
+            # DB 함수가 없는 경우에만 직원별 UPDATE로 처리 (없는 id는 0건 수정)
+            if not is_postgrest_error(e, MISSING_FUNCTION_ERROR_CODES):
+                raise
+            updated_count = 0
+            for row in rows:
+                result = supabase.table('employees').update({
+                    'total_annual_leave': row['total_annual_leave'],
+                    'updated_at': row['updated_at']
+                }).eq('id', row['id']).execute()
+                updated_count += len(result.data or [])
+        
+        _fetch_employees_raw.clear()
+        return updated_count > 0
+        
+    except Exception as e:
+        st.error(f"연차 일괄 업데이트 오류: {str(e)}")
+        return False
+
 # ============================================
 # 퇴직금 계산 함수
 # ============================================
@@ -426,7 +614,7 @@ def calculate_severance_pay(hire_date, resignation_date, recent_salaries):
             }
         
         if recent_salaries and len(recent_salaries) > 0:
-            average_monthly_wage = sum(recent_salaries) / len(recent_salaries)
+            average_monthly_wage = float(np.mean(recent_salaries))
         else:
             average_monthly_wage = 0
         
@@ -467,18 +655,7 @@ def calculate_comprehensive_payroll(employee_data, pay_month, supabase=None, all
         
         # 수당 설정 (기본값 또는 전달받은 값)
         if allowances is None:
-            allowances = {
-                'performance_bonus': 0,
-                'attendance_allowance': 0,
-                'meal_allowance': 130000,  # 기본 식대
-                'holiday_allowance': 0,
-                'position_allowance': 0,
-                'special_duty_allowance': 0,
-                'overtime_allowance': 0,
-                'skill_allowance': 0,
-                'annual_leave_allowance': 0,
-                'other_allowance': 0
-            }
+            allowances = dict(DEFAULT_ALLOWANCES)
         
         # 근태 기반 차감 계산
         attendance_deductions = get_employee_deductions(supabase, employee_id, pay_month) if supabase and employee_id else {
@@ -494,20 +671,27 @@ def calculate_comprehensive_payroll(employee_data, pay_month, supabase=None, all
             base_salary, attendance_deductions['late_hours'], year, month
         )
         
-        # 총 지급액 계산 (기본급 + 각종 수당)
-        total_allowances = sum(allowances.values())
+        # 총 지급액 계산 (기본급 + 각종 수당, 수당 항목별 금액은 한 번만 정리하여 결과에 재사용)
+        allowance_amounts = {key: allowances.get(key, 0) for key in ALLOWANCE_KEYS}
+        total_allowances = sum(allowance_amounts.values())
         gross_pay = base_salary + total_allowances
         
         # 근태 차감 후 실제 급여
         adjusted_salary = gross_pay - attendance_deductions['unpaid_deduction'] - attendance_deductions['lateness_deduction']
         adjusted_salary = max(0, adjusted_salary)
         
-        # 4대보험 계산 (조정된 급여 기준)
-        pension_base = min(max(adjusted_salary, PENSION_LIMITS['min']), PENSION_LIMITS['max'])
-        national_pension = int(pension_base * INSURANCE_RATES['national_pension'])
-        health_insurance = int(adjusted_salary * INSURANCE_RATES['health_insurance'])
-        long_term_care = int(health_insurance * INSURANCE_RATES['long_term_care'])
-        employment_insurance = int(adjusted_salary * INSURANCE_RATES['employment_insurance'])
+        # 4대보험 요율/국민연금 상하한은 지역 변수로 한 번만 조회
+        pension_rate, health_rate, long_term_care_rate, employment_rate = (
+            INSURANCE_RATES[key] for key in ('national_pension', 'health_insurance', 'long_term_care', 'employment_insurance')
+        )
+        pension_min, pension_max = PENSION_LIMITS['min'], PENSION_LIMITS['max']
+        
+        # 4대보험 계산 (조정된 급여 기준, 스칼라 연산으로 원 단위 절사)
+        pension_base = min(max(adjusted_salary, pension_min), pension_max)
+        national_pension = int(pension_base * pension_rate)
+        health_insurance = int(adjusted_salary * health_rate)
+        long_term_care = int(health_insurance * long_term_care_rate)
+        employment_insurance = int(adjusted_salary * employment_rate)
         
         # 올바른 세금 계산 적용 (test9.py 방식)
         tax_result = calculate_correct_taxes_for_payroll(adjusted_salary, family_count)
@@ -528,16 +712,7 @@ def calculate_comprehensive_payroll(employee_data, pay_month, supabase=None, all
             'employee_id': employee_id,
             'pay_month': pay_month,
             'base_salary': base_salary,
-            'performance_bonus': allowances.get('performance_bonus', 0),
-            'attendance_allowance': allowances.get('attendance_allowance', 0),
-            'meal_allowance': allowances.get('meal_allowance', 0),
-            'holiday_allowance': allowances.get('holiday_allowance', 0),
-            'position_allowance': allowances.get('position_allowance', 0),
-            'special_duty_allowance': allowances.get('special_duty_allowance', 0),
-            'overtime_allowance': allowances.get('overtime_allowance', 0),
-            'skill_allowance': allowances.get('skill_allowance', 0),
-            'annual_leave_allowance': allowances.get('annual_leave_allowance', 0),
-            'other_allowance': allowances.get('other_allowance', 0),
+            **allowance_amounts,
             'adjusted_salary': adjusted_salary,
             'unpaid_days': attendance_deductions['unpaid_days'],
             'unpaid_deduction': attendance_deductions['unpaid_deduction'],
@@ -568,15 +743,161 @@ def calculate_comprehensive_payroll(employee_data, pay_month, supabase=None, all
         st.error(f"급여 계산 오류: {str(e)}")
         return None
 
+def get_monthly_attendance_summary(supabase, start_date, end_date):
+    """기간 내 직원별 무급휴가 일수/지각·조퇴 시간 집계 (DB 함수 우선, 없으면 직접 집계)"""
+    try:
+        result = supabase.rpc('monthly_attendance_summary', {
+            'p_start_date': start_date.isoformat(),
+            'p_end_date': end_date.isoformat()
+        }).execute()
+        summary_df = pd.DataFrame(result.data or [], columns=['employee_id', 'unpaid_days', 'late_hours'])
+        summary_df[['unpaid_days', 'late_hours']] = summary_df[['unpaid_days', 'late_hours']].apply(pd.to_numeric, errors='coerce').fillna(0)
+        return summary_df.set_index('employee_id')
+    except Exception as e:
+        # DB 함수가 없는 경우에만 근태 기록을 조회하여 집계 (그 밖의 오류는 호출부에서 보고)
+        if not is_postgrest_error(e, MISSING_FUNCTION_ERROR_CODES):
+            raise
+    
+    attendance_df = get_attendance(supabase, None, start_date, end_date, ('무급휴가', '지각', '조퇴'), ATTENDANCE_DEDUCTION_COLUMNS)
+    if attendance_df.empty or 'status' not in attendance_df.columns:
+        return pd.DataFrame()
+    
+    return pd.DataFrame({
+        'employee_id': attendance_df['employee_id'],
+        'unpaid_days': attendance_df['status'].eq('무급휴가'),
+        'late_hours': calculate_attendance_late_hours(attendance_df),
+    }).groupby('employee_id').sum()
+
+def calculate_comprehensive_payroll_df(employees_df, pay_month, supabase=None, allowances=None):
+    """직원 전체 급여 일괄 계산 (직원별 반복 없이 컬럼 단위로 계산, 근태 조회 1회)"""
+    try:
+        if employees_df.empty:
+            return pd.DataFrame()
+
+        if allowances is None:
+            allowances = dict(DEFAULT_ALLOWANCES)
+
+        year, month = map(int, pay_month.split('-'))
+        period = pd.Period(year=year, month=month, freq='M')
+        start_date, end_date = period.start_time.date(), period.end_time.date()
+
+        payroll_df = pd.DataFrame({
+            'employee_id': employees_df['id'].to_numpy(),
+            'pay_month': pay_month,
+            'base_salary': pd.to_numeric(employees_df['base_salary'], errors='coerce').fillna(0).astype('int64').to_numpy(),
+        })
+        if 'family_count' in employees_df.columns:
+            family_count = pd.to_numeric(employees_df['family_count'], errors='coerce').fillna(1).astype('int64').to_numpy()
+        else:
+            family_count = np.ones(len(employees_df), dtype=np.int64)
+
+        # 기본급이 없는 직원은 계산 대상에서 제외 (개별 계산과 동일)
+        valid = payroll_df['base_salary'].to_numpy() > 0
+        payroll_df = payroll_df[valid].reset_index(drop=True)
+        family_count = family_count[valid]
+        if payroll_df.empty:
+            return pd.DataFrame()
+
+        allowance_amounts = {key: allowances.get(key, 0) for key in ALLOWANCE_KEYS}
+        for key, amount in allowance_amounts.items():
+            payroll_df[key] = amount
+
+        # 해당 월 직원별 근태 집계를 한 번만 조회
+        payroll_df['unpaid_days'] = 0
+        payroll_df['late_hours'] = 0.0
+        attendance_summary = get_monthly_attendance_summary(supabase, start_date, end_date) if supabase else pd.DataFrame()
+        if not attendance_summary.empty:
+            employee_ids = payroll_df['employee_id']
+            payroll_df['unpaid_days'] = employee_ids.map(attendance_summary['unpaid_days']).fillna(0).astype('int64')
+            payroll_df['late_hours'] = employee_ids.map(attendance_summary['late_hours']).fillna(0).round(2)
+
+        # 무급휴가 및 지각/조퇴 차감액 계산
+        base_salary = payroll_df['base_salary'].to_numpy()
+        unpaid_days = payroll_df['unpaid_days'].to_numpy()
+        late_hours = payroll_df['late_hours'].to_numpy()
+        total_workdays = get_workdays_in_month(year, month)
+        payroll_df['unpaid_deduction'] = np.where(unpaid_days > 0, base_salary / total_workdays * unpaid_days, 0).astype(np.int64)
+        payroll_df['lateness_deduction'] = np.where(late_hours > 0, base_salary / (total_workdays * 8) * late_hours, 0).astype(np.int64)
+
+        # 총 지급액 및 근태 차감 후 실제 급여
+        gross_pay = base_salary + sum(allowance_amounts.values())
+        adjusted_salary = np.maximum(gross_pay - payroll_df['unpaid_deduction'].to_numpy() - payroll_df['lateness_deduction'].to_numpy(), 0)
+        payroll_df['adjusted_salary'] = adjusted_salary
+
+        # 4대보험 계산 (조정된 급여 기준)
+        pension_base = np.clip(adjusted_salary, PENSION_LIMITS['min'], PENSION_LIMITS['max'])
+        insurance = (np.column_stack([pension_base, adjusted_salary, adjusted_salary]) * INSURANCE_RATE_VEC).astype(np.int64)
+        payroll_df['national_pension'] = insurance[:, 0]
+        payroll_df['health_insurance'] = insurance[:, 1]
+        payroll_df['long_term_care'] = (insurance[:, 1] * INSURANCE_RATES['long_term_care']).astype(np.int64)
+        payroll_df['employment_insurance'] = insurance[:, 2]
+
+        # 세금 계산 (전체 직원 배열 연산)
+        tax_result = calculate_correct_taxes_vec(adjusted_salary, family_count)
+        payroll_df['income_tax'] = tax_result['income_tax']
+        payroll_df['resident_tax'] = tax_result['resident_tax']
+
+        # 총 공제액 및 실지급액
+        payroll_df['total_deductions'] = payroll_df[[
+            'national_pension', 'health_insurance', 'long_term_care', 'employment_insurance',
+            'income_tax', 'resident_tax', 'unpaid_deduction', 'lateness_deduction'
+        ]].sum(axis=1)
+        payroll_df['net_pay'] = gross_pay - payroll_df['total_deductions'].to_numpy()
+        payroll_df['is_paid'] = False
+        payroll_df['pay_date'] = None
+
+        payroll_df['taxable_income'] = tax_result['taxable_income']
+        payroll_df['effective_tax_rate'] = tax_result['effective_rate']
+        for key in ['salary_income_deduction', 'personal_deductions', 'child_tax_credit',
+                    'annual_income_tax_before_credit', 'annual_income_tax_after_credit']:
+            payroll_df[key] = tax_result[key]
+
+        return payroll_df
+
+    except Exception as e:
+        st.error(f"일괄 급여 계산 오류: {str(e)}")
+        return pd.DataFrame()
+
 # ============================================
 # 이메일 발송 함수
 # ============================================
 
-def send_payslip_email(employee_email, pdf_buffer, employee_name, pay_month):
-    """급여명세서 이메일 발송"""
+# 일괄 발송 시 동시에 처리할 SMTP 발송 작업 수 (secrets의 SMTP_MAX_WORKERS로 변경 가능)
+EMAIL_SEND_WORKERS = 4
+
+def get_email_send_workers():
+    """일괄 이메일 발송 동시 작업 수 (SMTP 서버 제한에 맞게 설정)"""
+    try:
+        return max(1, int(st.secrets.get("SMTP_MAX_WORKERS", EMAIL_SEND_WORKERS)))
+    except Exception:
+        return EMAIL_SEND_WORKERS
+
+def open_smtp_connection():
+    """SMTP 서버 연결 및 로그인 (여러 건 발송 시 연결 재사용용)"""
+    smtp_server = st.secrets.get("SMTP_SERVER", "smtp.gmail.com")
+    smtp_port = int(st.secrets.get("SMTP_PORT", 587))
+    sender_email = st.secrets.get("SENDER_EMAIL", "")
+    sender_password = st.secrets.get("SENDER_PASSWORD", "")
+    
+    server = smtplib.SMTP(smtp_server, smtp_port)
+    try:
+        server.starttls()
+        server.login(sender_email, sender_password)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+def close_smtp_connection(server):
+    """SMTP 연결 종료 (이미 끊긴 연결은 무시)"""
+    try:
+        server.quit()
+    except Exception:
+        server.close()
+
+def send_payslip_email(employee_email, pdf_buffer, employee_name, pay_month, smtp_conn=None):
+    """급여명세서 이메일 발송 (smtp_conn을 주면 열린 연결을 재사용)"""
     try:
-        smtp_server = st.secrets.get("SMTP_SERVER", "smtp.gmail.com")
-        smtp_port = int(st.secrets.get("SMTP_PORT", 587))
         sender_email = st.secrets.get("SENDER_EMAIL", "")
         sender_password = st.secrets.get("SENDER_PASSWORD", "")
         
@@ -619,21 +940,234 @@ def send_payslip_email(employee_email, pdf_buffer, employee_name, pay_month):
             
             msg.attach(part)
         
-        server = smtplib.SMTP(smtp_server, smtp_port)
-        server.starttls()
-        server.login(sender_email, sender_password)
         text = msg.as_string()
-        server.sendmail(sender_email, employee_email, text)
-        server.quit()
+        if smtp_conn is not None:
+            smtp_conn.sendmail(sender_email, employee_email, text)
+        else:
+            server = open_smtp_connection()
+            try:
+                server.sendmail(sender_email, employee_email, text)
+            finally:
+                close_smtp_connection(server)
         
         return True, "이메일이 성공적으로 발송되었습니다."
         
     except Exception as e:
-        return False, f"이메일 발송 실패: {str(e)}"# =======
-# =====================================
+        return False, f"이메일 발송 실패: {str(e)}"
+
+def send_payslip_emails_bulk(email_jobs, pay_month, on_progress=None):
+    """급여명세서 일괄 이메일 발송 (작업 스레드별로 SMTP 연결 1개를 재사용, 성공 건수 반환)"""
+    thread_state = threading.local()
+    opened_connections = []
+    lock = threading.Lock()
+    
+    def send_job(job):
+        email, pdf_buffer, name = job
+        server = getattr(thread_state, 'server', None)
+        if server is None:
+            try:
+                server = open_smtp_connection()
+            except Exception as e:
+                return False, f"SMTP 연결 실패: {str(e)}"
+            thread_state.server = server
+            with lock:
+                opened_connections.append(server)
+        
+        success, message = send_payslip_email(email, pdf_buffer, name, pay_month, smtp_conn=server)
+        if not success:
+            # 서버가 연결을 끊은 경우 다음 발송에서 새로 연결
+            try:
+                server.noop()
+            except Exception:
+                thread_state.server = None
+        return success, message
+    
+    success_count = 0
+    try:
+        with ThreadPoolExecutor(max_workers=get_email_send_workers()) as executor:
+            futures = [executor.submit(send_job, job) for job in email_jobs]
+            for idx, future in enumerate(as_completed(futures)):
+                success, _ = future.result()
+                if success:
+                    success_count += 1
+                if on_progress:
+                    on_progress((idx + 1) / len(futures))
+    finally:
+        for server in opened_connections:
+            close_smtp_connection(server)
+    
+    return success_count
+
+# ============================================
 # 데이터베이스 CRUD 함수들
 # ============================================
 
+# 조회 컬럼 목록 (화면/계산/PDF에서 실제 사용하는 컬럼만)
+EMPLOYEE_COLUMNS = (
+    'id,name,position,department,hire_date,base_salary,email,phone,family_count,'
+    'total_annual_leave,used_annual_leave,remaining_annual_leave,status,notes'
+)
+ATTENDANCE_COLUMNS = 'id,employee_id,date,clock_in,clock_out,actual_hours,status,notes'
+# 근태 차감(무급휴가/지각/조퇴) 집계에 필요한 컬럼만 조회
+ATTENDANCE_DEDUCTION_COLUMNS = 'employee_id,status,clock_in,actual_hours'
+PAYROLL_SAVE_COLUMNS = [
+    'employee_id', 'pay_month', 'base_salary', 'performance_bonus', 
+    'attendance_allowance', 'meal_allowance', 'holiday_allowance', 
+    'position_allowance', 'special_duty_allowance', 'overtime_allowance', 
+    'skill_allowance', 'annual_leave_allowance', 'other_allowance',
+    'adjusted_salary', 'unpaid_days', 'unpaid_deduction', 'late_hours', 
+    'lateness_deduction', 'national_pension', 'health_insurance', 
+    'long_term_care', 'employment_insurance', 'income_tax', 'resident_tax', 
+    'total_deductions', 'net_pay', 'is_paid', 'pay_date', 'created_at', 'updated_at'
+]
+PAYROLL_COLUMNS = 'id,' + ','.join(PAYROLL_SAVE_COLUMNS)
+
+# 급여 일괄 저장 시 요청 1회당 행 수
+PAYROLL_UPSERT_CHUNK_SIZE = 500
+
+# 표시/문자열 파싱에만 쓰이는 근태 컬럼 (Arrow 문자열로 저장하여 object 배열 대신 사용)
+ATTENDANCE_STRING_COLS = ['date', 'clock_in', 'clock_out', 'notes']
+
+# 반복되는 값이 적은 컬럼은 범주형으로 저장 (비교/집계를 정수 코드로 처리)
+EMPLOYEE_CATEGORY_COLS = ['department', 'status']
+ATTENDANCE_CATEGORY_COLS = ['status']
+
+# 정수형으로 변환할 숫자 컬럼
+EMPLOYEE_NUMERIC_COLS = ['base_salary', 'family_count', 'total_annual_leave', 'used_annual_leave', 'remaining_annual_leave']
+# 값 범위가 작은 컬럼 (가족 수/연차 일수)만 작은 정수형으로 저장 (기본급 등 금액 컬럼은 연봉 환산 등 곱셈이 있어 int64 유지)
+EMPLOYEE_SMALL_INT_COLS = ['family_count', 'total_annual_leave', 'used_annual_leave', 'remaining_annual_leave']
+PAYROLL_NUMERIC_COLS = [
+    'base_salary', 'performance_bonus', 'meal_allowance', 'position_allowance',
+    'overtime_allowance', 'national_pension', 'health_insurance', 
+    'long_term_care', 'employment_insurance', 'income_tax', 
+    'resident_tax', 'total_deductions', 'net_pay'
+]
+
+# 화면 표 컬럼 (존재하는 컬럼만 순서대로 표시)
+DASHBOARD_EMPLOYEE_DISPLAY_COLUMNS = ('name', 'position', 'department', 'base_salary', 'family_count', 'remaining_annual_leave', 'status')
+EMPLOYEE_DISPLAY_COLUMNS = ('id', 'name', 'position', 'department', 'base_salary', 'family_count', 'total_annual_leave', 'remaining_annual_leave', 'status', 'hire_date')
+ATTENDANCE_DISPLAY_COLUMNS = ('employee_name', 'date', 'clock_in', 'clock_out', 'actual_hours', 'status', 'notes')
+PAYROLL_DISPLAY_COLUMNS = ('employee_name', 'pay_month', 'base_salary', 'income_tax', 'resident_tax', 
+                           'total_deductions', 'net_pay', 'is_paid', 'pay_date')
+# 급여 데이터 조회 탭에서 필요한 컬럼만 조회 (표시 컬럼 + 직원 이름)
+PAYROLL_LOOKUP_COLUMNS = 'employee_id,pay_month,base_salary,income_tax,resident_tax,total_deductions,net_pay,is_paid,pay_date,employees(name)'
+LEAVE_TOTAL_COLUMNS = ['total_annual_leave', 'used_annual_leave', 'remaining_annual_leave']
+LEAVE_DISPLAY_COLUMNS = ('name', 'department', 'hire_date', 'total_annual_leave', 'used_annual_leave', 'remaining_annual_leave', 'status')
+
+def get_available_columns(df, display_columns):
+    """표시 컬럼 중 데이터프레임에 있는 컬럼 목록 (표시 순서 유지)"""
+    frame_columns = set(df.columns)
+    return [col for col in display_columns if col in frame_columns]
+
+def to_arrow_table(df):
+    """화면 표시용 Arrow 테이블 변환 (변환할 수 없는 컬럼이 있으면 원본 반환)"""
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowException, TypeError, ValueError):
+        return df
+
+# PostgREST 기본 최대 응답 행 수 (이를 넘는 테이블은 페이지 단위로 나누어 조회)
+SUPABASE_PAGE_SIZE = 1000
+
+def fetch_all_pages(build_query, page_size=SUPABASE_PAGE_SIZE):
+    """정렬된 쿼리를 range 페이지 단위로 반복 조회하여 전체 행 반환 (페이지마다 새 쿼리 생성)"""
+    rows = []
+    offset = 0
+    while True:
+        page = build_query().range(offset, offset + page_size - 1).execute().data or []
+        # 서버의 max_rows가 page_size보다 작으면 페이지가 덜 채워져 오므로 빈 페이지가 올 때까지 받은 행 수만큼 진행
+        if not page:
+            return rows
+        rows.extend(page)
+        offset += len(page)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_employees_raw(_supabase):
+    """직원 테이블 원본 조회 (60초 캐시, 쓰기 시 무효화)"""
+    return fetch_all_pages(lambda: _supabase.table('employees').select(EMPLOYEE_COLUMNS).order('id'))
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_attendance_raw(_supabase, employee_id=None, start_date=None, end_date=None, status=None, columns=None):
+    """근태 테이블 원본 조회 (60초 캐시, 쓰기 시 무효화, columns 지정 시 해당 컬럼만 조회)"""
+    def build_query():
+        if columns:
+            query = _supabase.table('attendance').select(columns)
+        else:
+            try:
+                query = _supabase.table('attendance').select(f'{ATTENDANCE_COLUMNS},employees(name)')
+            except:
+                query = _supabase.table('attendance').select(ATTENDANCE_COLUMNS)
+        
+        if employee_id:
+            query = query.eq('employee_id', employee_id)
+        if start_date:
+            query = query.gte('date', start_date.isoformat())
+        if end_date:
+            query = query.lte('date', end_date.isoformat())
+        if isinstance(status, str):
+            query = query.eq('status', status)
+        elif status:
+            query = query.in_('status', list(status))
+        
+        # 같은 날짜 안에서도 페이지 경계가 흔들리지 않도록 id로 2차 정렬
+        return query.order('date', desc=True).order('id')
+        
+    return fetch_all_pages(build_query)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_payroll_raw(_supabase, employee_id=None, pay_month=None, columns=None):
+    """급여 테이블 원본 조회 (60초 캐시, 쓰기 시 무효화, columns 지정 시 해당 컬럼만 조회)"""
+    def build_query():
+        if columns:
+            query = _supabase.table('payroll').select(columns)
+        else:
+            try:
+                query = _supabase.table('payroll').select(f'{PAYROLL_COLUMNS},employees(name)')
+            except:
+                query = _supabase.table('payroll').select(PAYROLL_COLUMNS)
+        
+        if isinstance(employee_id, (list, tuple)):
+            query = query.in_('employee_id', list(employee_id))
+        elif employee_id:
+            query = query.eq('employee_id', employee_id)
+        if isinstance(pay_month, (list, tuple)):
+            query = query.in_('pay_month', list(pay_month))
+        elif pay_month:
+            query = query.eq('pay_month', pay_month)
+        
+        # 같은 월 안에서도 페이지 경계가 흔들리지 않도록 employee_id로 2차 정렬
+        return query.order('pay_month', desc=True).order('employee_id')
+        
+    return fetch_all_pages(build_query)
+
+def flatten_employee_name(df):
+    """조인된 employees(name) 컬럼을 employee_name 문자열 컬럼으로 변환"""
+    if 'employees' in df.columns:
+        df['employee_name'] = [
+            (employee.get('name') or '') if isinstance(employee, dict) else ''
+            for employee in df.pop('employees')
+        ]
+    return df
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_record_counts(_supabase, tables):
+    """테이블별 전체 행 수 조회 (행 데이터 없이 count만, 테이블별 요청은 동시에 실행, 60초 캐시, 쓰기 시 무효화)"""
+    def count_rows(table):
+        return _supabase.table(table).select('id', count='exact').limit(1).execute().count or 0
+    
+    with ThreadPoolExecutor(max_workers=len(tables)) as executor:
+        return dict(zip(tables, executor.map(count_rows, tables)))
+
+def get_record_counts(supabase, tables=('attendance', 'payroll')):
+    """테이블별 전체 행 수 조회 ({테이블명: 건수})"""
+    try:
+        if supabase is None:
+            return dict.fromkeys(tables, 0)
+        return _fetch_record_counts(supabase, tuple(tables))
+    except Exception as e:
+        st.warning(f"데이터 건수를 불러올 수 없습니다: {str(e)}")
+        return dict.fromkeys(tables, 0)
+
 def get_employees(supabase):
     """직원 목록 조회"""
     try:
@@ -641,14 +1175,19 @@ def get_employees(supabase):
             st.warning("⚠️ 데이터베이스 연결이 없습니다.")
             return pd.DataFrame()
         
-        result = supabase.table('employees').select('*').order('id').execute()
+        data = _fetch_employees_raw(supabase)
         
-        if result.data:
-            df = pd.DataFrame(result.data)
-            numeric_columns = ['base_salary', 'family_count', 'total_annual_leave', 'used_annual_leave', 'remaining_annual_leave']
-            for col in numeric_columns:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+        if data:
+            df = pd.DataFrame(data)
+            numeric_columns = df.columns.intersection(EMPLOYEE_NUMERIC_COLS)
+            df[numeric_columns] = df[numeric_columns].apply(pd.to_numeric, errors='coerce').fillna(0).astype('int64')
+            small_int_columns = df.columns.intersection(EMPLOYEE_SMALL_INT_COLS)
+            df[small_int_columns] = df[small_int_columns].apply(pd.to_numeric, downcast='integer')
+            category_columns = df.columns.intersection(EMPLOYEE_CATEGORY_COLS)
+            df[category_columns] = df[category_columns].astype('category')
+            # 입사일은 조회 시 한 번만 datetime으로 변환 (hire_date 원본 문자열은 폼/PDF/저장용으로 유지)
+            if 'hire_date' in df.columns:
+                df['hire_dt'] = pd.to_datetime(df['hire_date'], format='%Y-%m-%d', errors='coerce')
             
             return df
         else:
@@ -670,6 +1209,7 @@ def add_employee(supabase, employee_data):
             employee_data['remaining_annual_leave'] = total_leave
             
         result = supabase.table('employees').insert(employee_data).execute()
+        _fetch_employees_raw.clear()
         return result.data is not None and len(result.data) > 0
         
     except Exception as e:
@@ -684,37 +1224,33 @@ def update_employee(supabase, employee_id, update_data):
             
         update_data['updated_at'] = datetime.now().isoformat()
         result = supabase.table('employees').update(update_data).eq('id', employee_id).execute()
+        _fetch_employees_raw.clear()
         return result.data is not None and len(result.data) > 0
         
     except Exception as e:
         st.error(f"직원 수정 오류: {str(e)}")
         return False
 
-def get_attendance(supabase, employee_id=None, start_date=None, end_date=None):
-    """근태 기록 조회"""
+def get_attendance(supabase, employee_id=None, start_date=None, end_date=None, status=None, columns=None):
+    """근태 기록 조회 (직원/기간/상태 필터는 DB에서 적용, columns 지정 시 해당 컬럼만 조회)"""
     try:
         if supabase is None:
             return pd.DataFrame()
             
-        try:
-            query = supabase.table('attendance').select('*, employees(name)')
-        except:
-            query = supabase.table('attendance').select('*')
+        data = _fetch_attendance_raw(supabase, employee_id, start_date, end_date, status, columns)
         
-        if employee_id:
-            query = query.eq('employee_id', employee_id)
-        if start_date:
-            query = query.gte('date', start_date.isoformat())
-        if end_date:
-            query = query.lte('date', end_date.isoformat())
-            
-        result = query.order('date', desc=True).execute()
-        
-        if result.data:
-            df = pd.DataFrame(result.data)
+        if data:
+            df = pd.DataFrame(data)
             if 'actual_hours' in df.columns:
                 df['actual_hours'] = pd.to_numeric(df['actual_hours'], errors='coerce').fillna(0)
-            return df
+            string_columns = df.columns.intersection(ATTENDANCE_STRING_COLS)
+            df[string_columns] = df[string_columns].astype('string[pyarrow]')
+            category_columns = df.columns.intersection(ATTENDANCE_CATEGORY_COLS)
+            df[category_columns] = df[category_columns].astype('category')
+            # 출근 시각은 조회 시 한 번만 분 단위로 변환 (clock_in 원본 문자열은 화면 표시용으로 유지)
+            if 'clock_in' in df.columns:
+                df['clock_in_minutes'] = parse_clock_minutes(df['clock_in'])
+            return flatten_employee_name(df)
         else:
             return pd.DataFrame()
             
@@ -722,12 +1258,51 @@ def get_attendance(supabase, employee_id=None, start_date=None, end_date=None):
         st.warning(f"근태 데이터를 불러올 수 없습니다: {str(e)}")
         return pd.DataFrame()
 
+def get_attendance_raw(supabase, employee_id=None, start_date=None, end_date=None, status=None, columns=None):
+    """근태 기록 원본 목록 조회 (집계 전용, DataFrame 변환 없음)"""
+    try:
+        if supabase is None:
+            return []
+        return _fetch_attendance_raw(supabase, employee_id, start_date, end_date, status, columns) or []
+    except Exception as e:
+        st.warning(f"근태 데이터를 불러올 수 없습니다: {str(e)}")
+        return []
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_monthly_leave_usage(_supabase):
+    """월별 연차 사용 건수 (연차 기록만 조회, 60초 캐시, 근태 추가 시 무효화)"""
+    leave_records = get_attendance_raw(_supabase, status='연차', columns='date')
+    if not leave_records:
+        return pd.DataFrame(columns=['month', 'count'])
+    
+    # 월(Period) 단위로 집계하고 문자열 변환은 집계된 월 라벨에만 적용
+    leave_dates = pd.to_datetime(pd.Series([record.get('date') for record in leave_records]), format='%Y-%m-%d', errors='coerce').dropna()
+    monthly_usage = leave_dates.dt.to_period('M').value_counts().sort_index()
+    monthly_usage.index = monthly_usage.index.astype(str)
+    return monthly_usage.rename_axis('month').reset_index(name='count')
+
 def add_attendance(supabase, attendance_data):
     """근태 기록 추가 및 연차 자동 관리"""
     try:
         if supabase is None:
             return False
         
+        # 근태 추가 + 연차 차감을 DB 함수 한 번의 호출(단일 트랜잭션)로 처리
+        try:
+            rpc_payload = {f'p_{key}': value for key, value in attendance_data.items()}
+            result = supabase.rpc('attendance_insert_with_leave', rpc_payload).execute()
+            _fetch_attendance_raw.clear()
+            _fetch_record_counts.clear()
+            if attendance_data.get('status') == '연차':
+                _fetch_employees_raw.clear()
+                get_monthly_leave_usage.clear()
+            return result.data is not None
+        except Exception as e:
+            # DB 함수가 없는 경우에만 기존 방식(추가 → 조회 → 수정)으로 처리
+            # (그 밖의 오류는 함수가 이미 커밋했을 수 있으므로 중복 추가/차감 없이 오류로 보고)
+            if not is_postgrest_error(e, MISSING_FUNCTION_ERROR_CODES):
+                raise
+        
         result = supabase.table('attendance').insert(attendance_data).execute()
         
         if result.data and attendance_data.get('status') == '연차':
@@ -747,43 +1322,30 @@ def add_attendance(supabase, attendance_data):
                 }
                 
                 supabase.table('employees').update(update_data).eq('id', employee_id).execute()
+                _fetch_employees_raw.clear()
+            get_monthly_leave_usage.clear()
         
+        _fetch_attendance_raw.clear()
+        _fetch_record_counts.clear()
         return result.data is not None and len(result.data) > 0
         
     except Exception as e:
         st.error(f"근태 기록 추가 오류: {str(e)}")
         return False
 
-def get_payroll(supabase, employee_id=None, pay_month=None):
-    """급여 데이터 조회"""
+def get_payroll(supabase, employee_id=None, pay_month=None, columns=None):
+    """급여 데이터 조회 (employee_id, pay_month는 단일 값 또는 목록, columns는 조회할 컬럼 문자열)"""
     try:
         if supabase is None:
             return pd.DataFrame()
             
-        try:
-            query = supabase.table('payroll').select('*, employees(name)')
-        except:
-            query = supabase.table('payroll').select('*')
+        data = _fetch_payroll_raw(supabase, employee_id, pay_month, columns)
         
-        if employee_id:
-            query = query.eq('employee_id', employee_id)
-        if pay_month:
-            query = query.eq('pay_month', pay_month)
-            
-        result = query.order('pay_month', desc=True).execute()
-        
-        if result.data:
-            df = pd.DataFrame(result.data)
-            numeric_columns = [
-                'base_salary', 'performance_bonus', 'meal_allowance', 'position_allowance',
-                'overtime_allowance', 'national_pension', 'health_insurance', 
-                'long_term_care', 'employment_insurance', 'income_tax', 
-                'resident_tax', 'total_deductions', 'net_pay'
-            ]
-            for col in numeric_columns:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-            return df
+        if data:
+            df = pd.DataFrame(data)
+            numeric_columns = df.columns.intersection(PAYROLL_NUMERIC_COLS)
+            df[numeric_columns] = df[numeric_columns].apply(pd.to_numeric, errors='coerce').fillna(0).astype('int64')
+            return flatten_employee_name(df)
         else:
             return pd.DataFrame()
             
@@ -791,199 +1353,379 @@ def get_payroll(supabase, employee_id=None, pay_month=None):
         st.warning(f"급여 데이터를 불러올 수 없습니다: {str(e)}")
         return pd.DataFrame()
 
-def save_payroll(supabase, payroll_data):
-    """급여 데이터 저장 (데이터베이스 스키마에 맞게 필터링)"""
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_monthly_payroll_totals_raw(_supabase):
+    """월별 급여 합계 뷰 조회 (60초 캐시, 급여 저장 시 무효화)"""
+    return _supabase.table('monthly_payroll_totals').select('pay_month,total_pay,employee_count').order('pay_month').execute().data
+
+def get_monthly_payroll_totals(supabase):
+    """월별 급여 지급 합계/인원 (DB 뷰 우선, 없으면 급여 데이터를 직접 집계)"""
+    if supabase is None:
+        return pd.DataFrame()
+    
     try:
-        if supabase is None:
-            return False
-        
-        # 데이터베이스 스키마에 존재하는 컬럼만 필터링
-        allowed_columns = [
-            'employee_id', 'pay_month', 'base_salary', 'performance_bonus', 
-            'attendance_allowance', 'meal_allowance', 'holiday_allowance', 
-            'position_allowance', 'special_duty_allowance', 'overtime_allowance', 
-            'skill_allowance', 'annual_leave_allowance', 'other_allowance',
-            'adjusted_salary', 'unpaid_days', 'unpaid_deduction', 'late_hours', 
-            'lateness_deduction', 'national_pension', 'health_insurance', 
-            'long_term_care', 'employment_insurance', 'income_tax', 'resident_tax', 
-            'total_deductions', 'net_pay', 'is_paid', 'pay_date', 'created_at', 'updated_at'
-        ]
-        
-        # 허용된 컬럼만 포함하여 새로운 딕셔너리 생성
-        filtered_payroll_data = {key: value for key, value in payroll_data.items() if key in allowed_columns}
-        
-        existing = supabase.table('payroll').select('id').eq('employee_id', filtered_payroll_data['employee_id']).eq('pay_month', filtered_payroll_data['pay_month']).execute()
-        
-        if existing.data:
-            filtered_payroll_data['updated_at'] = datetime.now().isoformat()
-            result = supabase.table('payroll').update(filtered_payroll_data).eq('employee_id', filtered_payroll_data['employee_id']).eq('pay_month', filtered_payroll_data['pay_month']).execute()
-        else:
-            filtered_payroll_data['created_at'] = datetime.now().isoformat()
-            filtered_payroll_data['updated_at'] = datetime.now().isoformat()
-            result = supabase.table('payroll').insert(filtered_payroll_data).execute()
-            
-        return result.data is not None and len(result.data) > 0
-        
+        data = _fetch_monthly_payroll_totals_raw(supabase)
+        monthly_payroll = pd.DataFrame(data or [], columns=['pay_month', 'total_pay', 'employee_count'])
+        monthly_payroll[['total_pay', 'employee_count']] = (
+            monthly_payroll[['total_pay', 'employee_count']].apply(pd.to_numeric, errors='coerce').fillna(0).astype('int64')
+        )
+        return monthly_payroll
     except Exception as e:
-        st.error(f"급여 데이터 저장 오류: {str(e)}")
-        return False
+        # 뷰가 없는 경우에만 급여 데이터를 조회하여 집계 (그 밖의 오류는 화면에 보고)
+        if not is_postgrest_error(e, MISSING_RELATION_ERROR_CODES):
+            st.error(f"❌ 월별 급여 합계 조회 오류: {str(e)}")
+            return pd.DataFrame()
+    
+    payroll_df = get_payroll(supabase, columns='employee_id,pay_month,net_pay')
+    if payroll_df.empty or 'pay_month' not in payroll_df.columns or 'net_pay' not in payroll_df.columns:
+        return pd.DataFrame()
+    
+    return payroll_df.groupby('pay_month').agg(
+        total_pay=('net_pay', 'sum'),
+        employee_count=('employee_id', 'count')
+    ).reset_index()
+
+def save_payroll_rows(supabase, payroll_rows):
+    """급여 데이터 여러 건 upsert 저장 (청크 단위 요청), 저장된 employee_id 집합 반환"""
+    saved_employee_ids = set()
+    if supabase is None or not payroll_rows:
+        return saved_employee_ids
+    
+    # 데이터베이스 스키마에 존재하는 컬럼만 포함하여 새로운 딕셔너리 생성
+    updated_at = datetime.now().isoformat()
+    filtered_payroll_list = []
+    for row in payroll_rows:
+        filtered_payroll_data = {key: value for key, value in row.items() if key in PAYROLL_SAVE_COLUMNS}
+        filtered_payroll_data['updated_at'] = updated_at
+        filtered_payroll_list.append(filtered_payroll_data)
+    
+    # (employee_id, pay_month) 기준 upsert: 재계산 시 기존 급여를 덮어씀
+    # created_at은 보내지 않음 (기존 행의 최초 생성일 유지, 신규 행은 supabase_functions.sql의 DB 기본값 now() 사용)
+    for i in range(0, len(filtered_payroll_list), PAYROLL_UPSERT_CHUNK_SIZE):
+        chunk = filtered_payroll_list[i:i + PAYROLL_UPSERT_CHUNK_SIZE]
+        try:
+            result = supabase.table('payroll').upsert(chunk, on_conflict='employee_id,pay_month').execute()
+            saved_employee_ids.update(row.get('employee_id') for row in (result.data or []))
+        except Exception as e:
+            st.error(f"급여 데이터 저장 오류: {str(e)}")
+    
+    _fetch_payroll_raw.clear()
+    _fetch_monthly_payroll_totals_raw.clear()
+    _fetch_record_counts.clear()
+    return saved_employee_ids
+
+def save_payroll(supabase, payroll_data):
+    """급여 데이터 저장 (단건 dict 또는 여러 건 list)"""
+    payroll_list = [payroll_data] if isinstance(payroll_data, dict) else list(payroll_data)
+    return len(save_payroll_rows(supabase, payroll_list)) > 0
+
+# ============================================
+# 통계 집계 함수
+# ============================================
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_dashboard_stats(employees_df):
+    """대시보드 주요 지표 집계 (총원, 재직자 수, 평균 기본급, 부서별 인원)"""
+    if employees_df.empty:
+        return {'total': 0, 'active': 0, 'avg_salary': None, 'dept_counts': pd.Series(dtype='int64')}
+    
+    status_counts = employees_df['status'].value_counts() if 'status' in employees_df.columns else pd.Series(dtype='int64')
+    return {
+        'total': len(employees_df),
+        'active': int(status_counts.get('재직', 0)),
+        'avg_salary': employees_df['base_salary'].mean() if 'base_salary' in employees_df.columns else None,
+        'dept_counts': employees_df['department'].value_counts() if 'department' in employees_df.columns else pd.Series(dtype='int64')
+    }
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_department_stats(employees_df):
+    """부서별 인원/평균 기본급/연차 합계 (부서 groupby 한 번으로 집계하여 통계 화면에서 공유)"""
+    if employees_df.empty or 'department' not in employees_df.columns:
+        return pd.DataFrame()
+    
+    aggregations = {'employee_count': ('department', 'size')}
+    if 'base_salary' in employees_df.columns:
+        aggregations['avg_salary'] = ('base_salary', 'mean')
+    for column in ['total_annual_leave', 'used_annual_leave', 'remaining_annual_leave']:
+        if column in employees_df.columns:
+            aggregations[column] = (column, 'sum')
+    
+    return employees_df.groupby('department', sort=False, observed=True).agg(**aggregations).reset_index()
+
+# ============================================
+# 차트 생성 함수 (입력 데이터가 같으면 캐시된 차트 사용, cache_data가 조회마다 복사본을 반환하므로 세션 간 공유 객체 없음)
+# ============================================
+
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
+def build_pie_figure(values, names, title):
+    """파이 차트 (값/이름 배열 기준)"""
+    return px.pie(values=values, names=names, title=title)
+
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
+def build_leave_usage_rate_figure(names, usage_rate):
+    """직원별 연차 사용률 막대 차트 (numpy 배열로 직접 구성)"""
+    usage_rate = np.asarray(usage_rate)
+    fig = go.Figure(go.Bar(
+        x=np.asarray(names),
+        y=usage_rate,
+        marker=dict(color=usage_rate, colorscale='RdYlGn_r', showscale=True)
+    ))
+    fig.update_layout(title="직원별 연차 사용률 (%)", xaxis_title='name', yaxis_title='usage_rate')
+    return fig
+
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
+def build_histogram_figure(values, title, x_label, nbins=10):
+    """히스토그램 막대 차트 (구간별 건수만 미리 집계하여 전달, 원본 값은 차트에 포함하지 않음)"""
+    values = pd.to_numeric(pd.Series(values), errors='coerce').dropna().to_numpy(dtype=np.float64)
+    counts, edges = np.histogram(values, bins=nbins)
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges)
+    ))
+    fig.update_layout(title=title, xaxis_title=x_label, yaxis_title='count', bargap=0)
+    return fig
+
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
+def build_dept_leave_figure(dept_stats):
+    """부서별 사용/잔여 연차 누적 막대 차트 (numpy 배열로 직접 구성)"""
+    departments = dept_stats['department'].to_numpy()
+    fig = go.Figure([
+        go.Bar(x=departments, y=dept_stats['used_annual_leave'].to_numpy(), name='used_annual_leave'),
+        go.Bar(x=departments, y=dept_stats['remaining_annual_leave'].to_numpy(), name='remaining_annual_leave')
+    ])
+    fig.update_layout(
+        title="부서별 연차 사용 현황",
+        barmode='relative',
+        xaxis_title='department',
+        yaxis_title='연차 일수',
+        legend_title_text='구분'
+    )
+    return fig
 
 # ============================================
 # PDF 생성 함수 (정확한 세금 정보 포함)
 # ============================================
 
-def generate_comprehensive_payslip_pdf(employee_data, payroll_data, pay_month):
+# 급여명세서 표 스타일 (폰트는 명세서 생성 시 별도 적용)
+EMP_INFO_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (3, 0), '#E8E8E8'),
+    ('BACKGROUND', (0, 1), (3, 1), '#F5F5F5'),
+    ('BACKGROUND', (0, 2), (3, 2), '#E8E8E8'),
+    ('TEXTCOLOR', (0, 0), (-1, -1), black),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, black),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+PAYROLL_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), '#4472C4'),
+    ('TEXTCOLOR', (0, 0), (-1, 0), 'white'),
+    ('BACKGROUND', (0, -1), (-1, -1), '#C5E0B4'),
+    ('TEXTCOLOR', (0, 1), (-1, -1), black),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, black),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+@st.cache_resource
+def get_payslip_styles(korean_font):
+    """급여명세서용 문단 스타일 생성 (한글 폰트 적용, 프로세스당 1회)"""
+    styles = getSampleStyleSheet()
+    
+    if korean_font != 'Helvetica':
+        styles['Title'].fontName = korean_font
+        styles['Normal'].fontName = korean_font
+        styles['Heading1'].fontName = korean_font
+    
+    return styles
+
+# 급여명세서 고정 문구 (Paragraph는 레이아웃 상태를 저장하므로 문서마다 새로 생성하고 문구만 공유)
+PAYSLIP_TITLE_TEXT = "<font size=18><b>급여명세서 (정확한 세금계산 적용)</b></font>"
+PAYSLIP_NOTE_TEMPLATE = """
+    <font size=9>
+    ※ 본 급여명세서는 급여 및 인사관리 시스템 v2.0 Complete에서 자동 생성되었습니다.<br/>
+    ※ 2025년 정확한 세율 기준으로 계산되었습니다 (급여소득공제 + 기본공제 + 자녀세액공제 적용).<br/>
+    ※ 지방소득세는 소득세의 10%로 계산됩니다.<br/>
+    ※ 급여 관련 문의사항은 인사팀으로 연락해 주시기 바랍니다.<br/>
+    ※ 발행일: {issued_date}
+    </font>
+    """
+
+def build_payslip_story(employee_data, payroll_data, pay_month, korean_font, styles, issued_date=None):
+    """급여명세서 본문(flowable 목록) 구성"""
+    story = []
+    issued_date_text = (issued_date or datetime.now().date()).strftime('%Y년 %m월 %d일')
+    
+    # 제목
+    story.append(Paragraph(PAYSLIP_TITLE_TEXT, styles['Title']))
+    story.append(Spacer(1, 20))
+    
+    # 직원 정보 테이블
+    emp_info_data = [
+        ['직원명', employee_data.get('name', ''), '부서', employee_data.get('department', '')],
+        ['직급', employee_data.get('position', ''), '급여월', pay_month],
+        ['발행일', issued_date_text, '부양가족수', f"{employee_data.get('family_count', 1)}명"]
+    ]
+    
+    emp_table = Table(emp_info_data, colWidths=[1.5*inch, 1.5*inch, 1.5*inch, 1.5*inch])
+    emp_table.setStyle(EMP_INFO_TABLE_STYLE)
+    emp_table.setStyle([('FONTNAME', (0, 0), (-1, -1), korean_font)])
+    
+    story.append(emp_table)
+    story.append(Spacer(1, 20))
+    
+    # 급여 내역 테이블
+    payroll_table_data = [
+        ['구분', '항목', '금액']
+    ]
+    
+    # 지급 항목
+    payroll_table_data.append(['지급', '기본급', f"{payroll_data.get('base_salary', 0):,}원"])
+    
+    allowances = [
+        ('performance_bonus', '성과급'),
+        ('meal_allowance', '식대'),
+        ('position_allowance', '직책수당'),
+        ('overtime_allowance', '연장근무수당'),
+        ('skill_allowance', '기술수당'),
+        ('other_allowance', '기타수당')
+    ]
+    
+    for key, name in allowances:
+        amount = payroll_data.get(key, 0)
+        if amount > 0:
+            payroll_table_data.append(['', name, f"{amount:,}원"])
+    
+    # 근태 차감이 있는 경우
+    if payroll_data.get('unpaid_deduction', 0) > 0:
+        payroll_table_data.append(['차감', f"무급휴가({payroll_data.get('unpaid_days', 0)}일)", f"-{payroll_data.get('unpaid_deduction', 0):,}원"])
+    
+    if payroll_data.get('lateness_deduction', 0) > 0:
+        payroll_table_data.append(['', f"지각/조퇴({payroll_data.get('late_hours', 0):.1f}시간)", f"-{payroll_data.get('lateness_deduction', 0):,}원"])
+    
+    payroll_table_data.append(['', '', ''])
+    
+    # 공제 항목
+    deductions = [
+        ('national_pension', '국민연금'),
+        ('health_insurance', '건강보험'),
+        ('long_term_care', '장기요양보험'),
+        ('employment_insurance', '고용보험'),
+        ('income_tax', '소득세'),
+        ('resident_tax', '지방소득세')
+    ]
+    
+    for key, name in deductions:
+        amount = payroll_data.get(key, 0)
+        payroll_table_data.append(['공제', name, f"{amount:,}원"])
+    
+    payroll_table_data.extend([
+        ['', '공제 합계', f"{payroll_data.get('total_deductions', 0):,}원"],
+        ['', '', ''],
+        ['실지급', '실지급액', f"{payroll_data.get('net_pay', 0):,}원"]
+    ])
+    
+    table = Table(payroll_table_data, colWidths=[1*inch, 2.5*inch, 2.5*inch])
+    table.setStyle(PAYROLL_TABLE_STYLE)
+    table.setStyle([('FONTNAME', (0, 0), (-1, -1), korean_font)])
+    
+    story.append(table)
+    story.append(Spacer(1, 30))
+    
+    # 정확한 세금 계산 정보 표시
+    if payroll_data.get('taxable_income') and payroll_data.get('effective_tax_rate'):
+        tax_info = f"""
+        <font size=9>
+        ✅ <b>정확한 2025년 세금 계산 적용</b><br/>
+        ※ 연간 총급여: {payroll_data.get('base_salary', 0) * 12:,}원<br/>
+        ※ 급여소득공제: {payroll_data.get('salary_income_deduction', 0):,}원<br/>
+        ※ 인적공제(기본공제): {payroll_data.get('personal_deductions', 0):,}원<br/>
+        ※ 연간 과세표준: {payroll_data.get('taxable_income', 0):,}원<br/>
+        ※ 자녀세액공제: {payroll_data.get('child_tax_credit', 0):,}원<br/>
+        ※ 소득세(공제전): {payroll_data.get('annual_income_tax_before_credit', 0):,}원<br/>
+        ※ 소득세(공제후): {payroll_data.get('annual_income_tax_after_credit', 0):,}원<br/>
+        ※ 지방소득세: 소득세의 10%<br/>
+        ※ 실효세율: {payroll_data.get('effective_tax_rate', 0):.2f}%
+        </font>
+        """
+        
+        tax_note = Paragraph(tax_info, styles['Normal'])
+        story.append(tax_note)
+        story.append(Spacer(1, 15))
+    
+    # 추가 정보
+    story.append(Paragraph(PAYSLIP_NOTE_TEMPLATE.format(issued_date=issued_date_text), styles['Normal']))
+    
+    return story
+
+def generate_comprehensive_payslip_pdf(employee_data, payroll_data, pay_month, issued_date=None):
     """완전한 급여명세서 PDF 생성 (정확한 세금계산 정보 포함)"""
     try:
         korean_font = setup_korean_font()
+        styles = get_payslip_styles(korean_font)
         
         buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=50, bottomMargin=50)
-        story = []
-        styles = getSampleStyleSheet()
-        
-        if korean_font != 'Helvetica':
-            styles['Title'].fontName = korean_font
-            styles['Normal'].fontName = korean_font
-            styles['Heading1'].fontName = korean_font
-        
-        # 제목
-        title = Paragraph("<font size=18><b>급여명세서 (정확한 세금계산 적용)</b></font>", styles['Title'])
-        story.append(title)
-        story.append(Spacer(1, 20))
-        
-        # 직원 정보 테이블
-        emp_info_data = [
-            ['직원명', employee_data.get('name', ''), '부서', employee_data.get('department', '')],
-            ['직급', employee_data.get('position', ''), '급여월', pay_month],
-            ['발행일', datetime.now().strftime('%Y년 %m월 %d일'), '부양가족수', f"{employee_data.get('family_count', 1)}명"]
-        ]
-        
-        emp_table = Table(emp_info_data, colWidths=[1.5*inch, 1.5*inch, 1.5*inch, 1.5*inch])
-        emp_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (3, 0), '#E8E8E8'),
-            ('BACKGROUND', (0, 1), (3, 1), '#F5F5F5'),
-            ('BACKGROUND', (0, 2), (3, 2), '#E8E8E8'),
-            ('TEXTCOLOR', (0, 0), (-1, -1), black),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, -1), korean_font),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, black),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
-        
-        story.append(emp_table)
-        story.append(Spacer(1, 20))
-        
-        # 급여 내역 테이블
-        payroll_table_data = [
-            ['구분', '항목', '금액']
-        ]
-        
-        # 지급 항목
-        payroll_table_data.append(['지급', '기본급', f"{payroll_data.get('base_salary', 0):,}원"])
-        
-        allowances = [
-            ('performance_bonus', '성과급'),
-            ('meal_allowance', '식대'),
-            ('position_allowance', '직책수당'),
-            ('overtime_allowance', '연장근무수당'),
-            ('skill_allowance', '기술수당'),
-            ('other_allowance', '기타수당')
-        ]
-        
-        for key, name in allowances:
-            amount = payroll_data.get(key, 0)
-            if amount > 0:
-                payroll_table_data.append(['', name, f"{amount:,}원"])
-        
-        # 근태 차감이 있는 경우
-        if payroll_data.get('unpaid_deduction', 0) > 0:
-            payroll_table_data.append(['차감', f"무급휴가({payroll_data.get('unpaid_days', 0)}일)", f"-{payroll_data.get('unpaid_deduction', 0):,}원"])
-        
-        if payroll_data.get('lateness_deduction', 0) > 0:
-            payroll_table_data.append(['', f"지각/조퇴({payroll_data.get('late_hours', 0):.1f}시간)", f"-{payroll_data.get('lateness_deduction', 0):,}원"])
-        
-        payroll_table_data.append(['', '', ''])
-        
-        # 공제 항목
-        deductions = [
-            ('national_pension', '국민연금'),
-            ('health_insurance', '건강보험'),
-            ('long_term_care', '장기요양보험'),
-            ('employment_insurance', '고용보험'),
-            ('income_tax', '소득세'),
-            ('resident_tax', '지방소득세')
-        ]
+        doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=50, bottomMargin=50, pageCompression=1)
+        doc.build(build_payslip_story(employee_data, payroll_data, pay_month, korean_font, styles, issued_date))
+        buffer.seek(0)
+        return buffer
         
-        for key, name in deductions:
-            amount = payroll_data.get(key, 0)
-            payroll_table_data.append(['공제', name, f"{amount:,}원"])
-        
-        payroll_table_data.extend([
-            ['', '공제 합계', f"{payroll_data.get('total_deductions', 0):,}원"],
-            ['', '', ''],
-            ['실지급', '실지급액', f"{payroll_data.get('net_pay', 0):,}원"]
-        ])
-        
-        table = Table(payroll_table_data, colWidths=[1*inch, 2.5*inch, 2.5*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), '#4472C4'),
-            ('TEXTCOLOR', (0, 0), (-1, 0), 'white'),
-            ('BACKGROUND', (0, -1), (-1, -1), '#C5E0B4'),
-            ('TEXTCOLOR', (0, 1), (-1, -1), black),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, -1), korean_font),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, black),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
-        
-        story.append(table)
-        story.append(Spacer(1, 30))
-        
-        # 정확한 세금 계산 정보 표시
-        if payroll_data.get('taxable_income') and payroll_data.get('effective_tax_rate'):
-            tax_info = f"""
-            <font size=9>
-            ✅ <b>정확한 2025년 세금 계산 적용</b><br/>
-            ※ 연간 총급여: {payroll_data.get('base_salary', 0) * 12:,}원<br/>
-            ※ 급여소득공제: {payroll_data.get('salary_income_deduction', 0):,}원<br/>
-            ※ 인적공제(기본공제): {payroll_data.get('personal_deductions', 0):,}원<br/>
-            ※ 연간 과세표준: {payroll_data.get('taxable_income', 0):,}원<br/>
-            ※ 자녀세액공제: {payroll_data.get('child_tax_credit', 0):,}원<br/>
-            ※ 소득세(공제전): {payroll_data.get('annual_income_tax_before_credit', 0):,}원<br/>
-            ※ 소득세(공제후): {payroll_data.get('annual_income_tax_after_credit', 0):,}원<br/>
-            ※ 지방소득세: 소득세의 10%<br/>
-            ※ 실효세율: {payroll_data.get('effective_tax_rate', 0):.2f}%
-            </font>
-            """
-            
-            tax_note = Paragraph(tax_info, styles['Normal'])
-            story.append(tax_note)
-            story.append(Spacer(1, 15))
+    except Exception as e:
+        st.error(f"PDF 생성 오류: {str(e)}")
+        return None
+
+def _to_json_value(value):
+    """numpy 스칼라 등 JSON 기본 변환이 안 되는 값 처리"""
+    return value.item() if hasattr(value, 'item') else str(value)
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _payslip_pdf_bytes(employee_json, payroll_json, pay_month, issued_date):
+    """급여명세서 PDF 바이트 생성 (직원/급여 데이터가 같으면 캐시 재사용)"""
+    pdf_buffer = generate_comprehensive_payslip_pdf(json.loads(employee_json), json.loads(payroll_json), pay_month, issued_date)
+    return pdf_buffer.getvalue() if pdf_buffer else None
+
+def get_payslip_pdf(employee_data, payroll_data, pay_month, issued_date=None):
+    """급여명세서 PDF 조회 (동일 입력은 캐시된 PDF 사용)"""
+    pdf_bytes = _payslip_pdf_bytes(
+        json.dumps(employee_data, sort_keys=True, default=_to_json_value),
+        json.dumps(payroll_data, sort_keys=True, default=_to_json_value),
+        pay_month,
+        issued_date or datetime.now().date()
+    )
+    return io.BytesIO(pdf_bytes) if pdf_bytes else None
+
+def generate_payslips_bulk(employees_df, payroll_df, pay_month, out_zip=None, issued_date=None):
+    """여러 직원 급여명세서를 ZIP 파일 하나로 생성 (PDF를 ZIP 항목에 바로 기록)"""
+    try:
+        if out_zip is None:
+            out_zip = io.BytesIO()
         
-        # 추가 정보
-        additional_info = f"""
-        <font size=9>
-        ※ 본 급여명세서는 급여 및 인사관리 시스템 v2.0 Complete에서 자동 생성되었습니다.<br/>
-        ※ 2025년 정확한 세율 기준으로 계산되었습니다 (급여소득공제 + 기본공제 + 자녀세액공제 적용).<br/>
-        ※ 지방소득세는 소득세의 10%로 계산됩니다.<br/>
-        ※ 급여 관련 문의사항은 인사팀으로 연락해 주시기 바랍니다.<br/>
-        ※ 발행일: {datetime.now().strftime('%Y년 %m월 %d일')}
-        </font>
-        """
+        # 폰트와 스타일은 한 번만 준비하여 모든 명세서에 재사용
+        korean_font = setup_korean_font()
+        styles = get_payslip_styles(korean_font)
+        employee_map = employees_df.set_index('id', drop=False).to_dict('index')
         
-        note = Paragraph(additional_info, styles['Normal'])
-        story.append(note)
+        with zipfile.ZipFile(out_zip, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+            for payroll_data in payroll_df.to_dict('records'):
+                employee_data = employee_map.get(payroll_data.get('employee_id'))
+                if employee_data is None:
+                    continue
+                
+                file_name = f"{employee_data['id']}_{employee_data.get('name', '')}_{pay_month}_급여명세서.pdf"
+                with zf.open(file_name, 'w') as fh:
+                    doc = SimpleDocTemplate(fh, pagesize=A4, topMargin=50, bottomMargin=50, pageCompression=1)
+                    doc.build(build_payslip_story(employee_data, payroll_data, pay_month, korean_font, styles, issued_date))
         
-        doc.build(story)
-        buffer.seek(0)
-        return buffer
+        if isinstance(out_zip, io.BytesIO):
+            out_zip.seek(0)
+        return out_zip
         
     except Exception as e:
-        st.error(f"PDF 생성 오류: {str(e)}")
+        st.error(f"명세서 일괄 생성 오류: {str(e)}")
         return None
 
 # ============================================
@@ -1059,6 +1801,11 @@ def main():
     st.title("💼 급여 및 인사 관리 시스템")
     st.markdown("✅ **새내기 사장님들을 위한 간편한 인사관리 및 급여처리 시스템입니다.**")
     
+    # 현재 시각 (재실행마다 한 번만 계산하여 화면/명세서 전체에서 공유)
+    now = datetime.now()
+    today = now.date()
+    current_month = now.strftime("%Y-%m")
+    
     # Supabase 초기화
     supabase = init_supabase()
     
@@ -1075,6 +1822,7 @@ def main():
             ### 2단계: 데이터베이스 테이블 생성
             1. Supabase Dashboard > SQL Editor 이동
             2. data.txt 파일의 모든 SQL 코드 복사 후 실행
+            3. supabase_functions.sql 실행 - 급여 upsert용 유니크 인덱스/생성일 기본값, DB 함수/집계 뷰
             
             ### 3단계: secrets.toml 설정
             ```toml
@@ -1085,6 +1833,7 @@ def main():
             SMTP_PORT = 587
             SENDER_EMAIL = "your_email@gmail.com"
             SENDER_PASSWORD = "your_app_password"
+            SMTP_MAX_WORKERS = 4  # (선택) 일괄 발송 동시 작업 수
             ```
             """)
         
@@ -1108,6 +1857,20 @@ def main():
     
     # 데이터 현황 표시 (사이드바)
     employees_df = get_employees(supabase)
+    
+    # 직원 데이터 유무/컬럼 구성은 조회 직후 한 번만 확인하여 각 메뉴 분기에서 공유
+    has_employees = not employees_df.empty
+    has_department = 'department' in employees_df.columns
+    has_status = 'status' in employees_df.columns
+    has_base_salary = 'base_salary' in employees_df.columns
+    has_annual_leave = 'total_annual_leave' in employees_df.columns
+    
+    # 직원 id → 이름/행 조회용 사전 (selectbox 표시 및 선택 직원 조회를 O(1)로 처리)
+    name_map = dict(zip(employees_df['id'], employees_df['name'])) if has_employees else {}
+    emp_row_map = employees_df.set_index('id', drop=False).to_dict('index') if has_employees else {}
+    # 재직 직원 (일괄 급여 계산/일괄 이메일 발송에서 공유)
+    active_employees = employees_df[employees_df['status'] == '재직'] if has_employees else employees_df
+    
     st.sidebar.markdown("---")
     st.sidebar.subheader("📊 현재 데이터")
     st.sidebar.metric("등록된 직원", len(employees_df))
@@ -1119,38 +1882,33 @@ def main():
         # 주요 지표
         col1, col2, col3, col4 = st.columns(4)
         
-        total_employees = len(employees_df)
-        active_employees = len(employees_df[employees_df['status'] == '재직']) if not employees_df.empty else 0
+        dashboard_stats = get_dashboard_stats(employees_df)
         
         with col1:
-            st.metric("총 직원 수", total_employees)
+            st.metric("총 직원 수", dashboard_stats['total'])
         
         with col2:
-            st.metric("재직 직원 수", active_employees)
+            st.metric("재직 직원 수", dashboard_stats['active'])
         
         with col3:
-            current_month = datetime.now().strftime("%Y-%m")
             st.metric("현재 월", current_month)
         
         with col4:
-            if not employees_df.empty and 'base_salary' in employees_df.columns:
-                avg_salary = employees_df['base_salary'].mean()
-                st.metric("평균 기본급", f"{avg_salary:,.0f}원")
+            if dashboard_stats['avg_salary'] is not None:
+                st.metric("평균 기본급", f"{dashboard_stats['avg_salary']:,.0f}원")
             else:
                 st.metric("평균 기본급", "0원")
         
         # 직원 목록
-        if not employees_df.empty:
+        if has_employees:
             st.subheader("👥 직원 목록")
-            display_columns = ['name', 'position', 'department', 'base_salary', 'family_count', 'remaining_annual_leave', 'status']
-            available_columns = [col for col in display_columns if col in employees_df.columns]
+            available_columns = get_available_columns(employees_df, DASHBOARD_EMPLOYEE_DISPLAY_COLUMNS)
             st.dataframe(employees_df[available_columns], use_container_width=True)
             
             # 부서별 분포 차트
-            if 'department' in employees_df.columns:
-                dept_count = employees_df['department'].value_counts()
-                fig = px.pie(values=dept_count.values, names=dept_count.index, 
-                           title="부서별 직원 분포")
+            if has_department:
+                dept_count = dashboard_stats['dept_counts']
+                fig = build_pie_figure(dept_count.to_numpy(), dept_count.index.to_numpy(), "부서별 직원 분포")
                 st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("등록된 직원이 없습니다. '직원 관리' 메뉴에서 직원을 등록해보세요.")
@@ -1164,7 +1922,7 @@ def main():
         with tab1:
             st.subheader("직원 목록")
             
-            if not employees_df.empty:
+            if has_employees:
                 # 필터링 옵션
                 col1, col2 = st.columns(2)
                 
@@ -1172,38 +1930,31 @@ def main():
                     status_filter = st.selectbox("상태 필터", ["전체", "재직", "휴직", "퇴직"])
                 
                 with col2:
-                    if 'department' in employees_df.columns:
+                    if has_department:
                         dept_list = employees_df['department'].dropna().unique().tolist()
                         dept_filter = st.selectbox("부서 필터", ["전체"] + dept_list)
                     else:
                         dept_filter = "전체"
                 
-                # 필터 적용
-                filtered_df = employees_df.copy()
+                # 필터 적용 (조건을 하나의 마스크로 합쳐 한 번만 선택)
+                filter_mask = pd.Series(True, index=employees_df.index)
                 if status_filter != "전체":
-                    filtered_df = filtered_df[filtered_df['status'] == status_filter]
-                if dept_filter != "전체" and 'department' in filtered_df.columns:
-                    filtered_df = filtered_df[filtered_df['department'] == dept_filter]
+                    filter_mask &= employees_df['status'] == status_filter
+                if dept_filter != "전체" and has_department:
+                    filter_mask &= employees_df['department'] == dept_filter
+                filtered_df = employees_df[filter_mask]
                 
                 # 직원 목록 표시
-                display_columns = ['id', 'name', 'position', 'department', 'base_salary', 'family_count', 'total_annual_leave', 'remaining_annual_leave', 'status', 'hire_date']
-                available_columns = [col for col in display_columns if col in filtered_df.columns]
+                available_columns = get_available_columns(filtered_df, EMPLOYEE_DISPLAY_COLUMNS)
                 st.dataframe(filtered_df[available_columns], use_container_width=True)
                 
                 # 연차 일괄 업데이트 버튼
                 if st.button("🔄 전체 직원 연차 자동 업데이트", key="update_all_annual_leave"):
-                    progress_bar = st.progress(0)
-                    status_text = st.empty()
+                    with st.spinner(f"{len(filtered_df)}명 연차 업데이트 중..."):
+                        result = update_employees_annual_leave_bulk(supabase, filtered_df)
                     
-                    for idx, (_, emp_data) in enumerate(filtered_df.iterrows()):
-                        status_text.text(f"{emp_data['name']}님 연차 업데이트 중...")
-                        update_employee_annual_leave(supabase, emp_data['id'], emp_data['hire_date'])
-                        progress_bar.progress((idx + 1) / len(filtered_df))
-                    
-                    status_text.text("연차 업데이트 완료!")
-                    st.success("✅ 모든 직원의 연차가 업데이트되었습니다!")
-                    time.sleep(1)
-                    st.rerun()
+                    if result:
+                        st.toast("✅ 모든 직원의 연차가 업데이트되었습니다!")
                 
             else:
                 st.info("등록된 직원이 없습니다.")
@@ -1218,7 +1969,7 @@ def main():
                     name = st.text_input("이름*", placeholder="홍길동")
                     position = st.text_input("직급", placeholder="대리")
                     department = st.text_input("부서", placeholder="개발팀")
-                    hire_date = st.date_input("입사일", value=datetime.now().date())
+                    hire_date = st.date_input("입사일", value=today)
                 
                 with col2:
                     base_salary = st.number_input("기본급", min_value=0, value=3000000, step=100000)
@@ -1252,24 +2003,22 @@ def main():
                     
                     result = add_employee(supabase, employee_data)
                     if result:
-                        st.success(f"✅ {name}님이 성공적으로 등록되었습니다! (연차 {preview_leave}일 자동 부여)")
-                        time.sleep(1)
-                        st.rerun()
+                        st.toast(f"✅ {name}님이 성공적으로 등록되었습니다! (연차 {preview_leave}일 자동 부여)")
                     else:
                         st.error("❌ 직원 등록에 실패했습니다.")
         
         with tab3:
             st.subheader("직원 정보 수정")
             
-            if not employees_df.empty:
+            if has_employees:
                 selected_employee = st.selectbox(
                     "수정할 직원 선택",
                     options=employees_df['id'].tolist(),
-                    format_func=lambda x: employees_df[employees_df['id'] == x]['name'].iloc[0]
+                    format_func=lambda x: name_map.get(x, '')
                 )
                 
                 if selected_employee:
-                    emp_data = employees_df[employees_df['id'] == selected_employee].iloc[0]
+                    emp_data = emp_row_map[selected_employee]
                     
                     with st.form("update_employee_form"):
                         col1, col2 = st.columns(2)
@@ -1278,7 +2027,7 @@ def main():
                             name = st.text_input("이름", value=emp_data['name'])
                             position = st.text_input("직급", value=emp_data.get('position', ''))
                             department = st.text_input("부서", value=emp_data.get('department', ''))
-                            hire_date = st.date_input("입사일", value=pd.to_datetime(emp_data['hire_date']).date())
+                            hire_date = st.date_input("입사일", value=date.fromisoformat(str(emp_data['hire_date'])[:10]))
                         
                         with col2:
                             base_salary = st.number_input("기본급", value=int(emp_data.get('base_salary', 0)), step=100000)
@@ -1314,14 +2063,12 @@ def main():
                                 'used_annual_leave': used_annual_leave,
                                 'remaining_annual_leave': remaining_annual_leave,
                                 'notes': notes,
-                                'updated_at': datetime.now().isoformat()
+                                'updated_at': now.isoformat()
                             }
                             
                             result = update_employee(supabase, selected_employee, update_data)
                             if result:
-                                st.success("✅ 직원 정보가 성공적으로 수정되었습니다!")
-                                time.sleep(1)
-                                st.rerun()
+                                st.toast("✅ 직원 정보가 성공적으로 수정되었습니다!")
                             else:
                                 st.error("❌ 정보 수정에 실패했습니다.")
             else:
@@ -1339,35 +2086,29 @@ def main():
             col1, col2, col3 = st.columns(3)
             
             with col1:
-                if not employees_df.empty:
+                if has_employees:
                     selected_emp = st.selectbox(
                         "직원 선택",
                         options=[None] + employees_df['id'].tolist(),
-                        format_func=lambda x: "전체 직원" if x is None else employees_df[employees_df['id'] == x]['name'].iloc[0]
+                        format_func=lambda x: "전체 직원" if x is None else name_map.get(x, '')
                     )
                 else:
                     st.info("등록된 직원이 없습니다.")
                     selected_emp = None
             
             with col2:
-                start_date = st.date_input("시작일", value=datetime.now().date().replace(day=1))
+                start_date = st.date_input("시작일", value=today.replace(day=1))
             
             with col3:
-                end_date = st.date_input("종료일", value=datetime.now().date())
+                end_date = st.date_input("종료일", value=today)
             
             if selected_emp is not None or selected_emp is None:
                 attendance_df = get_attendance(supabase, selected_emp, start_date, end_date)
                 
                 if not attendance_df.empty:
-                    # 근태 데이터 표시
-                    display_df = attendance_df.copy()
-                    if 'employees' in display_df.columns:
-                        display_df['employee_name'] = display_df['employees'].apply(
-                            lambda x: x['name'] if isinstance(x, dict) and x else ''
-                        )
-                    
-                    display_columns = ['employee_name', 'date', 'clock_in', 'clock_out', 'actual_hours', 'status', 'notes']
-                    available_columns = [col for col in display_columns if col in display_df.columns]
+                    # 근태 데이터 표시 (조회 결과는 매번 새로 만든 DataFrame이므로 복사 없이 사용)
+                    display_df = attendance_df
+                    available_columns = get_available_columns(display_df, ATTENDANCE_DISPLAY_COLUMNS)
                     st.dataframe(display_df[available_columns], use_container_width=True)
                     
                     # 통계 정보
@@ -1383,12 +2124,12 @@ def main():
                     
                     with col3:
                         if 'status' in attendance_df.columns:
-                            late_days = len(attendance_df[attendance_df['status'] == '지각'])
+                            late_days = int(attendance_df['status'].eq('지각').sum())
                             st.metric("지각 일수", late_days)
                     
                     with col4:
                         if 'status' in attendance_df.columns:
-                            annual_leave_days = len(attendance_df[attendance_df['status'] == '연차'])
+                            annual_leave_days = int(attendance_df['status'].eq('연차').sum())
                             st.metric("연차 사용일수", annual_leave_days)
                 
                 else:
@@ -1397,7 +2138,7 @@ def main():
         with tab2:
             st.subheader("근태 기록 입력")
             
-            if not employees_df.empty:
+            if has_employees:
                 with st.form("attendance_form"):
                     col1, col2 = st.columns(2)
                     
@@ -1405,13 +2146,13 @@ def main():
                         employee_id = st.selectbox(
                             "직원 선택",
                             options=employees_df['id'].tolist(),
-                            format_func=lambda x: employees_df[employees_df['id'] == x]['name'].iloc[0]
+                            format_func=lambda x: name_map.get(x, '')
                         )
-                        date = st.date_input("날짜", value=datetime.now().date())
-                        clock_in = st.time_input("출근 시간", value=datetime.strptime("09:00", "%H:%M").time())
+                        work_date = st.date_input("날짜", value=today)
+                        clock_in = st.time_input("출근 시간", value=STANDARD_CLOCK_IN)
                     
                     with col2:
-                        clock_out = st.time_input("퇴근 시간", value=datetime.strptime("18:00", "%H:%M").time())
+                        clock_out = st.time_input("퇴근 시간", value=STANDARD_CLOCK_OUT)
                         status = st.selectbox("상태", ["정상", "지각", "조퇴", "연차", "결근", "휴가", "무급휴가"])
                         notes = st.text_area("특이사항")
                     
@@ -1419,8 +2160,8 @@ def main():
                     work_hours = 0
                     if clock_in and clock_out and status not in ['연차', '결근', '무급휴가']:
                         try:
-                            clock_in_dt = datetime.combine(date, clock_in)
-                            clock_out_dt = datetime.combine(date, clock_out)
+                            clock_in_dt = datetime.combine(work_date, clock_in)
+                            clock_out_dt = datetime.combine(work_date, clock_out)
                             if clock_out_dt > clock_in_dt:
                                 work_hours = (clock_out_dt - clock_in_dt).total_seconds() / 3600 - 1  # 점심시간 1시간 제외
                                 work_hours = max(0, work_hours)
@@ -1433,8 +2174,8 @@ def main():
                     if status == '무급휴가':
                         st.warning("⚠️ 무급휴가는 해당 일의 급여가 차감됩니다.")
                         if employee_id:
-                            emp_data = employees_df[employees_df['id'] == employee_id].iloc[0]
-                            year, month = date.year, date.month
+                            emp_data = emp_row_map[employee_id]
+                            year, month = work_date.year, work_date.month
                             workdays = get_workdays_in_month(year, month)
                             daily_wage = emp_data['base_salary'] / workdays
                             st.info(f"📉 일급 차감액: {daily_wage:,.0f}원 (월 기본급 ÷ {workdays}일)")
@@ -1445,7 +2186,7 @@ def main():
                     
                     # 연차 사용 시 잔여일수 확인
                     if status == '연차' and employee_id:
-                        emp_data = employees_df[employees_df['id'] == employee_id].iloc[0]
+                        emp_data = emp_row_map[employee_id]
                         remaining_leave = emp_data.get('remaining_annual_leave', 0)
                         if remaining_leave <= 0:
                             st.error("❌ 잔여 연차가 없습니다!")
@@ -1457,14 +2198,14 @@ def main():
                     if submit_button:
                         # 연차 사용 시 잔여일수 재확인
                         if status == '연차':
-                            emp_data = employees_df[employees_df['id'] == employee_id].iloc[0]
+                            emp_data = emp_row_map[employee_id]
                             if emp_data.get('remaining_annual_leave', 0) <= 0:
                                 st.error("❌ 잔여 연차가 부족하여 저장할 수 없습니다.")
                                 st.stop()
                         
                         attendance_data = {
                             'employee_id': employee_id,
-                            'date': date.isoformat(),
+                            'date': work_date.isoformat(),
                             'clock_in': clock_in.isoformat() if status not in ['연차', '결근', '무급휴가'] else '00:00:00',
                             'clock_out': clock_out.isoformat() if status not in ['연차', '결근', '무급휴가'] else '00:00:00',
                             'actual_hours': work_hours if status not in ['연차', '결근', '무급휴가'] else 0,
@@ -1477,9 +2218,7 @@ def main():
                             success_msg = "✅ 근태 기록이 성공적으로 저장되었습니다!"
                             if status == '연차':
                                 success_msg += " (연차 1일 자동 차감)"
-                            st.success(success_msg)
-                            time.sleep(1)
-                            st.rerun()
+                            st.toast(success_msg)
                         else:
                             st.error("❌ 근태 기록 저장에 실패했습니다.")
             else:
@@ -1488,20 +2227,16 @@ def main():
         with tab3:
             st.subheader("근태 현황 분석")
             
-            if not employees_df.empty:
+            if has_employees:
                 # 이번 달 근태 현황
-                current_month_start = datetime.now().replace(day=1).date()
-                current_month_end = datetime.now().date()
+                current_month_start = today.replace(day=1)
+                current_month_end = today
                 
                 monthly_attendance = get_attendance(supabase, None, current_month_start, current_month_end)
                 
                 if not monthly_attendance.empty:
                     # 직원별 근태 현황
-                    if 'employees' in monthly_attendance.columns:
-                        monthly_attendance['employee_name'] = monthly_attendance['employees'].apply(
-                            lambda x: x['name'] if isinstance(x, dict) and x else ''
-                        )
-                        
+                    if 'employee_name' in monthly_attendance.columns:
                         if 'actual_hours' in monthly_attendance.columns and not monthly_attendance['employee_name'].empty:
                             emp_hours = monthly_attendance.groupby('employee_name')['actual_hours'].sum().reset_index()
                             
@@ -1516,9 +2251,10 @@ def main():
                     
                     # 근태 상태 분포
                     if 'status' in monthly_attendance.columns:
-                        status_dist = monthly_attendance['status'].value_counts()
+                        # 범주형 컬럼은 건수 0인 범주도 반환하므로 실제 발생한 상태만 표시
+                        status_dist = monthly_attendance['status'].value_counts()[lambda counts: counts > 0]
                         if not status_dist.empty:
-                            fig3 = px.pie(values=status_dist.values, names=status_dist.index, title='근태 상태별 분포')
+                            fig3 = build_pie_figure(status_dist.to_numpy(), status_dist.index.to_numpy(), '근태 상태별 분포')
                             st.plotly_chart(fig3, use_container_width=True)
                 
                 else:
@@ -1535,21 +2271,21 @@ def main():
         with tab1:
             st.subheader("개별 급여 계산 (모든 수당 포함)")
             
-            if not employees_df.empty:
+            if has_employees:
                 col1, col2 = st.columns(2)
                 
                 with col1:
                     selected_employee = st.selectbox(
                         "직원 선택",
                         options=employees_df['id'].tolist(),
-                        format_func=lambda x: employees_df[employees_df['id'] == x]['name'].iloc[0]
+                        format_func=lambda x: name_map.get(x, '')
                     )
                 
                 with col2:
-                    pay_month = st.text_input("급여 대상 월", value=datetime.now().strftime("%Y-%m"))
+                    pay_month = st.text_input("급여 대상 월", value=current_month)
                 
                 if selected_employee:
-                    emp_data = employees_df[employees_df['id'] == selected_employee].iloc[0].to_dict()
+                    emp_data = emp_row_map[selected_employee]
                     
                     # 수당 입력 섹션
                     st.subheader("💵 수당 설정")
@@ -1625,13 +2361,17 @@ def main():
                                         st.metric("지각/조퇴 시간", f"{payroll_result['late_hours']:.1f}시간")
                                         st.metric("지각/조퇴 차감액", f"{payroll_result['lateness_deduction']:,}원")
                             
+                            # 요약 수치는 한 번만 계산
+                            total_allowances = sum(payroll_result.get(key, 0) for key in allowances)
+                            gross_pay = payroll_result['base_salary'] + total_allowances
+                            net_pay_delta = payroll_result['net_pay'] - gross_pay
+                            
                             col1, col2 = st.columns(2)
                             
                             with col1:
                                 st.write("**💰 지급 내역**")
                                 st.write(f"기본급: {payroll_result['base_salary']:,}원")
                                 
-                                total_allowances = sum([payroll_result.get(key, 0) for key in allowances.keys()])
                                 if total_allowances > 0:
                                     st.write(f"총 수당: {total_allowances:,}원")
                                     for key, name in [
@@ -1661,11 +2401,10 @@ def main():
                             
                             with col2:
                                 st.write("**📊 요약**")
-                                gross_pay = payroll_result['base_salary'] + total_allowances
                                 st.metric("총 지급액", f"{gross_pay:,}원")
                                 st.metric("총 공제액", f"{payroll_result['total_deductions']:,}원")
                                 st.metric("실지급액", f"{payroll_result['net_pay']:,}원", 
-                                        delta=f"{payroll_result['net_pay'] - gross_pay:,}원")
+                                        delta=f"{net_pay_delta:,}원")
                                 st.metric("실효세율", f"{payroll_result['effective_tax_rate']:.2f}%")
                             
                             # 급여 데이터 저장
@@ -1684,8 +2423,8 @@ def main():
         with tab2:
             st.subheader("일괄 급여 계산")
             
-            if not employees_df.empty:
-                pay_month = st.text_input("급여 대상 월", value=datetime.now().strftime("%Y-%m"), key="batch_month")
+            if has_employees:
+                pay_month = st.text_input("급여 대상 월", value=current_month, key="batch_month")
                 
                 # 공통 수당 설정
                 st.write("**공통 수당 설정 (모든 직원에게 적용)**")
@@ -1719,41 +2458,47 @@ def main():
                     progress_bar = st.progress(0)
                     status_text = st.empty()
                     
-                    active_employees = employees_df[employees_df['status'] == '재직']
-                    total_employees = len(active_employees)
+                    # 전체 재직 직원 급여를 한 번에 계산 (근태 조회 1회)
+                    status_text.text("전체 직원 급여 계산 중...")
+                    batch_payroll_df = calculate_comprehensive_payroll_df(active_employees, pay_month, supabase, batch_allowances)
+                    batch_records = batch_payroll_df.to_dict('records')
+                    # 직원별 수당 합계는 열 단위로 한 번에 계산
+                    batch_allowance_totals = (
+                        batch_payroll_df.reindex(columns=list(batch_allowances), fill_value=0)
+                        .to_numpy(dtype=np.int64).sum(axis=1).tolist()
+                    )
                     payroll_results = []
                     
-                    for idx, (_, emp_data) in enumerate(active_employees.iterrows()):
-                        status_text.text(f"{emp_data['name']}님 급여 계산 중...")
-                        
-                        payroll_result = calculate_comprehensive_payroll(emp_data.to_dict(), pay_month, supabase, batch_allowances)
-                        
-                        if payroll_result:
-                            save_result = save_payroll(supabase, payroll_result)
-                            if save_result:
-                                payroll_results.append({
-                                    'name': emp_data['name'],
-                                    'base_salary': payroll_result['base_salary'],
-                                    'total_allowances': sum([payroll_result.get(key, 0) for key in batch_allowances.keys()]),
-                                    'income_tax': payroll_result['income_tax'],
-                                    'resident_tax': payroll_result['resident_tax'],
-                                    'effective_rate': payroll_result['effective_tax_rate'],
-                                    'net_pay': payroll_result['net_pay'],
-                                    'status': '성공'
-                                })
-                            else:
-                                payroll_results.append({
-                                    'name': emp_data['name'],
-                                    'base_salary': 0,
-                                    'total_allowances': 0,
-                                    'income_tax': 0,
-                                    'resident_tax': 0,
-                                    'effective_rate': 0,
-                                    'net_pay': 0,
-                                    'status': '실패'
-                                })
-                        
-                        progress_bar.progress((idx + 1) / total_employees)
+                    # 전체 급여를 한 번의 요청으로 저장
+                    status_text.text(f"{len(batch_records)}명 급여 저장 중...")
+                    saved_employee_ids = save_payroll_rows(supabase, batch_records)
+                    
+                    for payroll_result, total_allowances in zip(batch_records, batch_allowance_totals):
+                        employee_name = name_map.get(payroll_result['employee_id'], '')
+                        if payroll_result['employee_id'] in saved_employee_ids:
+                            payroll_results.append({
+                                'name': employee_name,
+                                'base_salary': payroll_result['base_salary'],
+                                'total_allowances': total_allowances,
+                                'income_tax': payroll_result['income_tax'],
+                                'resident_tax': payroll_result['resident_tax'],
+                                'effective_rate': payroll_result['effective_tax_rate'],
+                                'net_pay': payroll_result['net_pay'],
+                                'status': '성공'
+                            })
+                        else:
+                            payroll_results.append({
+                                'name': employee_name,
+                                'base_salary': 0,
+                                'total_allowances': 0,
+                                'income_tax': 0,
+                                'resident_tax': 0,
+                                'effective_rate': 0,
+                                'net_pay': 0,
+                                'status': '실패'
+                            })
+                    
+                    progress_bar.progress(1.0)
                     
                     status_text.text("급여 계산 완료!")
                     
@@ -1761,22 +2506,26 @@ def main():
                     if payroll_results:
                         st.subheader("급여 계산 결과 (정확한 세금 적용)")
                         results_df = pd.DataFrame(payroll_results)
-                        st.dataframe(results_df, use_container_width=True)
+                        st.dataframe(to_arrow_table(results_df), use_container_width=True)
                         
-                        successful_results = results_df[results_df['status'] == '성공']
-                        if not successful_results.empty:
+                        success_mask = (results_df['status'] == '성공').to_numpy()
+                        if success_mask.any():
+                            # 합계는 성공 건의 금액 컬럼을 한 번에 합산
+                            total_amount, income_tax_sum, resident_tax_sum, total_allowances = (
+                                results_df.loc[success_mask, ['net_pay', 'income_tax', 'resident_tax', 'total_allowances']]
+                                .to_numpy(dtype=np.int64).sum(axis=0).tolist()
+                            )
+                            total_tax = income_tax_sum + resident_tax_sum
+                            avg_tax_rate = float(results_df.loc[success_mask, 'effective_rate'].to_numpy(dtype=np.float64).mean())
+                            
                             col1, col2, col3, col4 = st.columns(4)
                             with col1:
-                                total_amount = successful_results['net_pay'].sum()
                                 st.metric("총 급여 지급액", f"{total_amount:,}원")
                             with col2:
-                                total_tax = successful_results['income_tax'].sum() + successful_results['resident_tax'].sum()
                                 st.metric("총 세금", f"{total_tax:,}원")
                             with col3:
-                                avg_tax_rate = successful_results['effective_rate'].mean()
                                 st.metric("평균 실효세율", f"{avg_tax_rate:.2f}%")
                             with col4:
-                                total_allowances = successful_results['total_allowances'].sum()
                                 st.metric("총 수당액", f"{total_allowances:,}원")
             
             else:
@@ -1795,38 +2544,39 @@ def main():
         with tab1:
             st.subheader("급여 명세서 생성 및 이메일 발송")
             
-            if not employees_df.empty:
+            if has_employees:
                 col1, col2 = st.columns(2)
                 
                 with col1:
                     selected_employee = st.selectbox(
                         "직원 선택",
                         options=employees_df['id'].tolist(),
-                        format_func=lambda x: employees_df[employees_df['id'] == x]['name'].iloc[0],
+                        format_func=lambda x: name_map.get(x, ''),
                         key="payslip_employee"
                     )
                 
                 with col2:
-                    pay_month = st.text_input("급여 월", value=datetime.now().strftime("%Y-%m"), key="payslip_month")
+                    pay_month = st.text_input("급여 월", value=current_month, key="payslip_month")
+                
+                # 해당 월 급여는 한 번만 조회하고 직원별 데이터는 메모리에서 필터링
+                month_payroll_df = get_payroll(supabase, pay_month=pay_month)
+                payroll_by_id = {row['employee_id']: row for row in month_payroll_df.to_dict('records')}
                 
                 if selected_employee:
-                    emp_data = employees_df[employees_df['id'] == selected_employee].iloc[0].to_dict()
+                    emp_data = emp_row_map[selected_employee]
+                    payroll_data = payroll_by_id.get(selected_employee)
                     
                     col1, col2 = st.columns(2)
                     
                     with col1:
                         if st.button("📄 명세서 생성", key="generate_payslip_pdf"):
-                            payroll_df = get_payroll(supabase, selected_employee, pay_month)
-                            
-                            if not payroll_df.empty:
-                                payroll_data = payroll_df.iloc[0].to_dict()
-                                
-                                pdf_buffer = generate_comprehensive_payslip_pdf(emp_data, payroll_data, pay_month)
+                            if payroll_data:
+                                pdf_buffer = get_payslip_pdf(emp_data, payroll_data, pay_month, today)
                                 
                                 if pdf_buffer:
                                     st.download_button(
                                         label="📄 급여명세서 다운로드",
-                                        data=pdf_buffer.getvalue(),
+                                        data=pdf_buffer,
                                         file_name=f"{emp_data['name']}_{pay_month}_급여명세서.pdf",
                                         mime="application/pdf"
                                     )
@@ -1842,12 +2592,8 @@ def main():
                             if not emp_data.get('email'):
                                 st.error("❌ 직원의 이메일 주소가 설정되지 않았습니다.")
                             else:
-                                payroll_df = get_payroll(supabase, selected_employee, pay_month)
-                                
-                                if not payroll_df.empty:
-                                    payroll_data = payroll_df.iloc[0].to_dict()
-                                    
-                                    pdf_buffer = generate_comprehensive_payslip_pdf(emp_data, payroll_data, pay_month)
+                                if payroll_data:
+                                    pdf_buffer = get_payslip_pdf(emp_data, payroll_data, pay_month, today)
                                     
                                     if pdf_buffer:
                                         success, message = send_payslip_email(
@@ -1866,12 +2612,30 @@ def main():
                                 else:
                                     st.error("❌ 해당 월의 급여 데이터가 없습니다.")
                     
+                    # 전체 명세서 ZIP 다운로드
+                    st.markdown("---")
+                    st.subheader("📦 전체 직원 명세서 일괄 다운로드")
+                    
+                    if st.button("📦 전체 명세서 ZIP 생성", key="generate_payslip_zip"):
+                        if month_payroll_df.empty:
+                            st.error("❌ 해당 월의 급여 데이터가 없습니다. 먼저 급여 계산을 진행해주세요.")
+                        else:
+                            zip_buffer = generate_payslips_bulk(employees_df, month_payroll_df, pay_month, issued_date=today)
+                            
+                            if zip_buffer:
+                                st.download_button(
+                                    label="📦 급여명세서 ZIP 다운로드",
+                                    data=zip_buffer,
+                                    file_name=f"{pay_month}_급여명세서.zip",
+                                    mime="application/zip"
+                                )
+                                st.success(f"✅ {len(month_payroll_df)}건의 급여명세서가 생성되었습니다!")
+                    
                     # 대량 이메일 발송
                     st.markdown("---")
                     st.subheader("📮 전체 직원 명세서 이메일 발송")
                     
                     if st.button("📧 전체 직원에게 명세서 이메일 발송", key="send_batch_payslip_email"):
-                        active_employees = employees_df[employees_df['status'] == '재직']
                         total_employees = len(active_employees)
                         
                         if total_employees == 0:
@@ -1879,34 +2643,24 @@ def main():
                         else:
                             progress_bar = st.progress(0)
                             status_text = st.empty()
-                            success_count = 0
                             
-                            for idx, (_, emp_data) in enumerate(active_employees.iterrows()):
-                                status_text.text(f"{emp_data['name']}님에게 이메일 발송 중...")
+                            # PDF는 순서대로 생성 (reportlab은 스레드 안전하지 않음)
+                            email_jobs = []
+                            for emp_data in active_employees.itertuples(index=False):
+                                status_text.text(f"{emp_data.name}님 명세서 생성 중...")
                                 
-                                if emp_data.get('email'):
-                                    # 급여 데이터 조회
-                                    payroll_df = get_payroll(supabase, emp_data['id'], pay_month)
+                                if getattr(emp_data, 'email', None):
+                                    payroll_data = payroll_by_id.get(emp_data.id)
                                     
-                                    if not payroll_df.empty:
-                                        payroll_data = payroll_df.iloc[0].to_dict()
-                                        
-                                        # PDF 생성 및 이메일 발송
-                                        pdf_buffer = generate_comprehensive_payslip_pdf(emp_data.to_dict(), payroll_data, pay_month)
+                                    if payroll_data:
+                                        pdf_buffer = get_payslip_pdf(emp_data._asdict(), payroll_data, pay_month, today)
                                         
                                         if pdf_buffer:
-                                            success, _ = send_payslip_email(
-                                                emp_data['email'], 
-                                                pdf_buffer, 
-                                                emp_data['name'], 
-                                                pay_month
-                                            )
-                                            
-                                            if success:
-                                                success_count += 1
-                                
-                                progress_bar.progress((idx + 1) / total_employees)
-                                time.sleep(0.5)  # 이메일 서버 부하 방지
+                                            email_jobs.append((emp_data.email, pdf_buffer, emp_data.name))
+                            
+                            # 이메일 발송은 네트워크 대기 시간이 대부분이므로 여러 건을 동시에 처리
+                            status_text.text(f"{len(email_jobs)}명에게 이메일 발송 중...")
+                            success_count = send_payslip_emails_bulk(email_jobs, pay_month, on_progress=progress_bar.progress)
                             
                             status_text.text("이메일 발송 완료!")
                             st.success(f"✅ {success_count}/{total_employees}명에게 급여명세서가 발송되었습니다!")
@@ -1917,7 +2671,7 @@ def main():
         with tab2:
             st.subheader("급여 데이터 조회")
             
-            payroll_df = get_payroll(supabase)
+            payroll_df = get_payroll(supabase, columns=PAYROLL_LOOKUP_COLUMNS)
             
             if not payroll_df.empty:
                 available_months = sorted(payroll_df['pay_month'].unique(), reverse=True)
@@ -1928,16 +2682,9 @@ def main():
                 else:
                     filtered_payroll = payroll_df
                 
-                if 'employees' in filtered_payroll.columns:
-                    filtered_payroll['employee_name'] = filtered_payroll['employees'].apply(
-                        lambda x: x['name'] if isinstance(x, dict) and x else ''
-                    )
-                
-                display_columns = ['employee_name', 'pay_month', 'base_salary', 'income_tax', 'resident_tax', 
-                                 'total_deductions', 'net_pay', 'is_paid', 'pay_date']
-                available_columns = [col for col in display_columns if col in filtered_payroll.columns]
+                available_columns = get_available_columns(filtered_payroll, PAYROLL_DISPLAY_COLUMNS)
                 
-                st.dataframe(filtered_payroll[available_columns], use_container_width=True)
+                st.dataframe(to_arrow_table(filtered_payroll[available_columns]), use_container_width=True)
                 
                 # 통계 정보
                 if selected_month != '전체':
@@ -1965,33 +2712,36 @@ def main():
     elif menu == "6. 퇴직금 계산":
         st.header("💼 퇴직금 계산")
         
-        if not employees_df.empty:
+        if has_employees:
             col1, col2 = st.columns(2)
             
             with col1:
                 selected_employee = st.selectbox(
                     "퇴직 직원 선택",
                     options=employees_df['id'].tolist(),
-                    format_func=lambda x: employees_df[employees_df['id'] == x]['name'].iloc[0]
+                    format_func=lambda x: name_map.get(x, '')
                 )
             
             with col2:
-                resignation_date = st.date_input("퇴직일", value=datetime.now().date())
+                resignation_date = st.date_input("퇴직일", value=today)
             
             if selected_employee:
-                emp_data = employees_df[employees_df['id'] == selected_employee].iloc[0]
+                emp_data = emp_row_map[selected_employee]
                 
                 # 최근 3개월 급여 조회
-                recent_months = []
-                for i in range(3):
-                    month = (datetime.now() - relativedelta(months=i)).strftime("%Y-%m")
-                    recent_months.append(month)
+                recent_months = [(now - relativedelta(months=i)).strftime("%Y-%m") for i in range(3)]
                 
+                # 3개월치 급여를 한 번에 조회하고 월 순서대로 정렬 (급여가 없는 달은 제외)
+                recent_payroll_df = get_payroll(supabase, selected_employee, recent_months)
                 recent_salaries = []
-                for month in recent_months:
-                    payroll_df = get_payroll(supabase, selected_employee, month)
-                    if not payroll_df.empty:
-                        recent_salaries.append(payroll_df.iloc[0]['base_salary'])
+                if not recent_payroll_df.empty:
+                    recent_salaries = (
+                        recent_payroll_df.drop_duplicates('pay_month')
+                        .set_index('pay_month')['base_salary']
+                        .reindex(recent_months)
+                        .dropna()
+                        .tolist()
+                    )
                 
                 # 급여 데이터가 없으면 현재 기본급 사용
                 if not recent_salaries:
@@ -2043,7 +2793,7 @@ def main():
                         update_data = {
                             'status': '퇴직',
                             'notes': f"퇴직일: {resignation_date}, 퇴직금: {severance_result['severance_pay']:,}원",
-                            'updated_at': datetime.now().isoformat()
+                            'updated_at': now.isoformat()
                         }
                         
                         result = update_employee(supabase, selected_employee, update_data)
@@ -2064,42 +2814,34 @@ def main():
         with tab1:
             st.subheader("직원별 연차 현황")
             
-            if not employees_df.empty:
+            if has_employees:
                 # 연차 현황 테이블
-                leave_columns = ['name', 'department', 'hire_date', 'total_annual_leave', 'used_annual_leave', 'remaining_annual_leave', 'status']
-                available_columns = [col for col in leave_columns if col in employees_df.columns]
+                available_columns = get_available_columns(employees_df, LEAVE_DISPLAY_COLUMNS)
                 
                 display_df = employees_df[available_columns].copy()
                 
                 # 연차 사용률 계산
                 if 'total_annual_leave' in display_df.columns and 'used_annual_leave' in display_df.columns:
-                    display_df['usage_rate'] = (display_df['used_annual_leave'] / display_df['total_annual_leave'] * 100).round(1)
+                    display_df['usage_rate'] = calculate_leave_usage_rate(display_df['used_annual_leave'], display_df['total_annual_leave'])
                 
-                st.dataframe(display_df, use_container_width=True)
+                st.dataframe(to_arrow_table(display_df), use_container_width=True)
                 
                 # 연차 사용률 차트
                 if 'usage_rate' in display_df.columns and not display_df.empty:
-                    fig = px.bar(
-                        display_df, 
-                        x='name', 
-                        y='usage_rate',
-                        title="직원별 연차 사용률 (%)",
-                        color='usage_rate',
-                        color_continuous_scale='RdYlGn_r'
-                    )
+                    fig = build_leave_usage_rate_figure(display_df['name'], display_df['usage_rate'])
                     st.plotly_chart(fig, use_container_width=True)
         
         with tab2:
             st.subheader("연차 부여 및 차감")
             
-            if not employees_df.empty:
+            if has_employees:
                 col1, col2 = st.columns(2)
                 
                 with col1:
                     selected_employee = st.selectbox(
                         "직원 선택",
                         options=employees_df['id'].tolist(),
-                        format_func=lambda x: employees_df[employees_df['id'] == x]['name'].iloc[0],
+                        format_func=lambda x: name_map.get(x, ''),
                         key="leave_management_employee"
                     )
                 
@@ -2107,7 +2849,7 @@ def main():
                     action_type = st.selectbox("작업 유형", ["연차 부여", "연차 차감", "연차 초기화"])
                 
                 if selected_employee:
-                    emp_data = employees_df[employees_df['id'] == selected_employee].iloc[0]
+                    emp_data = emp_row_map[selected_employee]
                     
                     # 현재 연차 정보 표시
                     col1, col2, col3 = st.columns(3)
@@ -2130,13 +2872,12 @@ def main():
                                 'total_annual_leave': new_total,
                                 'remaining_annual_leave': new_remaining,
                                 'notes': f"{emp_data.get('notes', '')} [연차부여: +{additional_days}일 - {reason}]",
-                                'updated_at': datetime.now().isoformat()
+                                'updated_at': now.isoformat()
                             }
                             
                             result = update_employee(supabase, selected_employee, update_data)
                             if result:
-                                st.success(f"✅ {additional_days}일의 연차가 부여되었습니다!")
-                                st.rerun()
+                                st.toast(f"✅ {additional_days}일의 연차가 부여되었습니다!")
                     
                     elif action_type == "연차 차감":
                         deduct_days = st.number_input("차감할 연차 일수", min_value=1, value=1, max_value=emp_data.get('remaining_annual_leave', 0))
@@ -2150,13 +2891,12 @@ def main():
                                 'used_annual_leave': new_used,
                                 'remaining_annual_leave': new_remaining,
                                 'notes': f"{emp_data.get('notes', '')} [연차차감: -{deduct_days}일 - {reason}]",
-                                'updated_at': datetime.now().isoformat()
+                                'updated_at': now.isoformat()
                             }
                             
                             result = update_employee(supabase, selected_employee, update_data)
                             if result:
-                                st.success(f"✅ {deduct_days}일의 연차가 차감되었습니다!")
-                                st.rerun()
+                                st.toast(f"✅ {deduct_days}일의 연차가 차감되었습니다!")
                     
                     elif action_type == "연차 초기화":
                         st.warning("⚠️ 연차 초기화는 신중하게 진행해주세요.")
@@ -2170,23 +2910,20 @@ def main():
                                 'total_annual_leave': auto_calculated_leave,
                                 'used_annual_leave': 0,
                                 'remaining_annual_leave': auto_calculated_leave,
-                                'notes': f"{emp_data.get('notes', '')} [연차초기화: {datetime.now().strftime('%Y-%m-%d')}]",
-                                'updated_at': datetime.now().isoformat()
+                                'notes': f"{emp_data.get('notes', '')} [연차초기화: {today.isoformat()}]",
+                                'updated_at': now.isoformat()
                             }
                             
                             result = update_employee(supabase, selected_employee, update_data)
                             if result:
-                                st.success(f"✅ 연차가 {auto_calculated_leave}일로 초기화되었습니다!")
-                                st.rerun()
+                                st.toast(f"✅ 연차가 {auto_calculated_leave}일로 초기화되었습니다!")
         
         with tab3:
             st.subheader("연차 사용 통계")
             
-            if not employees_df.empty:
-                # 전체 연차 통계
-                total_granted = employees_df['total_annual_leave'].sum()
-                total_used = employees_df['used_annual_leave'].sum()
-                total_remaining = employees_df['remaining_annual_leave'].sum()
+            if has_employees:
+                # 전체 연차 통계 (부여/사용/잔여 합계를 한 번에 집계)
+                total_granted, total_used, total_remaining = employees_df[LEAVE_TOTAL_COLUMNS].sum().tolist()
                 
                 col1, col2, col3, col4 = st.columns(4)
                 
@@ -2204,46 +2941,30 @@ def main():
                     st.metric("전체 사용률", f"{usage_rate:.1f}%")
                 
                 # 부서별 연차 사용 현황
-                if 'department' in employees_df.columns:
-                    dept_stats = employees_df.groupby('department').agg({
-                        'total_annual_leave': 'sum',
-                        'used_annual_leave': 'sum',
-                        'remaining_annual_leave': 'sum'
-                    }).reset_index()
-                    
-                    dept_stats['usage_rate'] = (dept_stats['used_annual_leave'] / dept_stats['total_annual_leave'] * 100).round(1)
-                    
-                    fig = px.bar(
-                        dept_stats,
-                        x='department',
-                        y=['used_annual_leave', 'remaining_annual_leave'],
-                        title="부서별 연차 사용 현황",
-                        labels={'value': '연차 일수', 'variable': '구분'}
-                    )
+                if has_department:
+                    dept_stats = get_department_stats(employees_df)
+                    
+                    dept_stats['usage_rate'] = calculate_leave_usage_rate(dept_stats['used_annual_leave'], dept_stats['total_annual_leave'])
+                    
+                    fig = build_dept_leave_figure(dept_stats)
                     st.plotly_chart(fig, use_container_width=True)
                 
                 # 월별 연차 사용 추이 (근태 데이터 기반)
-                attendance_df = get_attendance(supabase)
-                if not attendance_df.empty and 'status' in attendance_df.columns:
-                    annual_leave_df = attendance_df[attendance_df['status'] == '연차']
-                    
-                    if not annual_leave_df.empty and 'date' in annual_leave_df.columns:
-                        annual_leave_df['month'] = pd.to_datetime(annual_leave_df['date']).dt.strftime('%Y-%m')
-                        monthly_usage = annual_leave_df.groupby('month').size().reset_index(name='count')
-                        
-                        fig2 = px.line(
-                            monthly_usage,
-                            x='month',
-                            y='count',
-                            title="월별 연차 사용 추이",
-                            markers=True
-                        )
-                        st.plotly_chart(fig2, use_container_width=True) 
+                monthly_usage = get_monthly_leave_usage(supabase)
+                if not monthly_usage.empty:
+                    fig2 = px.line(
+                        monthly_usage,
+                        x='month',
+                        y='count',
+                        title="월별 연차 사용 추이",
+                        markers=True
+                    )
+                    st.plotly_chart(fig2, use_container_width=True) 
    # 8. 통계 및 분석
     elif menu == "8. 통계 및 분석":
         st.header("📊 통계 및 분석")
         
-        if not employees_df.empty:
+        if has_employees:
             tab1, tab2, tab3, tab4 = st.tabs(["인사 통계", "급여 분석", "근태 분석", "연차 분석"])
             
             with tab1:
@@ -2253,26 +2974,26 @@ def main():
                 
                 with col1:
                     # 부서별 직원 수
-                    if 'department' in employees_df.columns:
-                        dept_count = employees_df['department'].value_counts()
-                        fig1 = px.pie(values=dept_count.values, names=dept_count.index, 
-                                     title="부서별 직원 분포")
+                    if has_department:
+                        dept_stats = get_department_stats(employees_df)
+                        fig1 = build_pie_figure(dept_stats['employee_count'].to_numpy(), dept_stats['department'].to_numpy(), "부서별 직원 분포")
                         st.plotly_chart(fig1, use_container_width=True)
                 
                 with col2:
                     # 상태별 직원 수
-                    if 'status' in employees_df.columns:
+                    if has_status:
                         status_count = employees_df['status'].value_counts()
                         fig2 = px.bar(x=status_count.index, y=status_count.values, 
                                      title="직원 상태별 분포")
                         st.plotly_chart(fig2, use_container_width=True)
                 
+                # 조회 시 변환해 둔 입사일(hire_dt)을 입사년도/근속년수 분석에 공유
+                hire_dt = employees_df.get('hire_dt')
+                
                 # 입사년도별 분석
-                if 'hire_date' in employees_df.columns and not employees_df.empty:
+                if hire_dt is not None:
                     try:
-                        employees_df_copy = employees_df.copy()
-                        employees_df_copy['hire_year'] = pd.to_datetime(employees_df_copy['hire_date'], errors='coerce').dt.year
-                        hire_year_count = employees_df_copy['hire_year'].dropna().value_counts().sort_index()
+                        hire_year_count = hire_dt.dt.year.dropna().value_counts().sort_index()
                         
                         if len(hire_year_count) > 0:
                             fig3 = px.line(x=hire_year_count.index, y=hire_year_count.values, 
@@ -2282,15 +3003,11 @@ def main():
                         st.warning(f"입사년도 분석 중 오류: {str(e)}")
                 
                 # 근속년수 분포
-                if 'hire_date' in employees_df.columns:
+                if hire_dt is not None:
                     try:
-                        employees_df_copy = employees_df.copy()
-                        employees_df_copy['work_years'] = employees_df_copy['hire_date'].apply(
-                            lambda x: (datetime.now().date() - pd.to_datetime(x).date()).days / 365.25
-                        )
+                        work_years = (pd.Timestamp(today) - hire_dt).dt.days / 365.25
                         
-                        fig4 = px.histogram(employees_df_copy, x='work_years', nbins=10, 
-                                           title="근속년수 분포")
+                        fig4 = build_histogram_figure(work_years, "근속년수 분포", 'work_years')
                         st.plotly_chart(fig4, use_container_width=True)
                     except Exception as e:
                         st.warning(f"근속년수 분석 중 오류: {str(e)}")
@@ -2298,59 +3015,53 @@ def main():
             with tab2:
                 st.subheader("급여 분석")
                 
-                if 'base_salary' in employees_df.columns:
-                    # 급여 통계 지표
+                if has_base_salary:
+                    # 급여 통계 지표 (기본급을 연속 배열로 한 번 변환 후 numpy 집계)
+                    salary_values = employees_df['base_salary'].to_numpy(dtype=np.float64, na_value=np.nan)
+                    salary_stats = {
+                        'mean': np.nanmean(salary_values),
+                        'median': np.nanmedian(salary_values),
+                        'min': np.nanmin(salary_values),
+                        'max': np.nanmax(salary_values)
+                    }
                     col1, col2, col3, col4 = st.columns(4)
                     
                     with col1:
-                        avg_salary = employees_df['base_salary'].mean()
-                        st.metric("평균 기본급", f"{avg_salary:,.0f}원")
+                        st.metric("평균 기본급", f"{salary_stats['mean']:,.0f}원")
                     
                     with col2:
-                        median_salary = employees_df['base_salary'].median()
-                        st.metric("중간값 기본급", f"{median_salary:,.0f}원")
+                        st.metric("중간값 기본급", f"{salary_stats['median']:,.0f}원")
                     
                     with col3:
-                        min_salary = employees_df['base_salary'].min()
-                        st.metric("최저 기본급", f"{min_salary:,.0f}원")
+                        st.metric("최저 기본급", f"{salary_stats['min']:,.0f}원")
                     
                     with col4:
-                        max_salary = employees_df['base_salary'].max()
-                        st.metric("최고 기본급", f"{max_salary:,.0f}원")
+                        st.metric("최고 기본급", f"{salary_stats['max']:,.0f}원")
                     
                     # 급여 분포 히스토그램
-                    fig4 = px.histogram(employees_df, x='base_salary', nbins=10, 
-                                       title="기본급 분포")
+                    fig4 = build_histogram_figure(employees_df['base_salary'], "기본급 분포", 'base_salary')
                     st.plotly_chart(fig4, use_container_width=True)
                     
                     # 부서별 평균 급여
-                    if 'department' in employees_df.columns:
-                        dept_salary = employees_df.groupby('department')['base_salary'].agg(['mean', 'count']).reset_index()
-                        dept_salary.columns = ['department', 'avg_salary', 'count']
+                    if has_department:
+                        dept_salary = get_department_stats(employees_df)
                         
                         if len(dept_salary) > 0:
                             fig5 = px.bar(dept_salary, x='department', y='avg_salary', 
                                          title="부서별 평균 기본급",
-                                         text='count',
-                                         labels={'count': '인원수'})
+                                         text='employee_count',
+                                         labels={'employee_count': '인원수'})
                             fig5.update_traces(texttemplate='%{text}명', textposition='outside')
                             st.plotly_chart(fig5, use_container_width=True)
                     
                     # 월별 급여 지급 현황
-                    payroll_df = get_payroll(supabase)
-                    if not payroll_df.empty and 'pay_month' in payroll_df.columns and 'net_pay' in payroll_df.columns:
-                        monthly_payroll = payroll_df.groupby('pay_month').agg({
-                            'net_pay': 'sum',
-                            'employee_id': 'count'
-                        }).reset_index()
-                        monthly_payroll.columns = ['pay_month', 'total_pay', 'employee_count']
-                        
-                        if not monthly_payroll.empty:
-                            fig6 = px.line(monthly_payroll, x='pay_month', y='total_pay', 
-                                          title="월별 총 급여 지급액",
-                                          text='employee_count')
-                            fig6.update_traces(texttemplate='%{text}명', textposition='top center')
-                            st.plotly_chart(fig6, use_container_width=True)
+                    monthly_payroll = get_monthly_payroll_totals(supabase)
+                    if not monthly_payroll.empty:
+                        fig6 = px.line(monthly_payroll, x='pay_month', y='total_pay', 
+                                      title="월별 총 급여 지급액",
+                                      text='employee_count')
+                        fig6.update_traces(texttemplate='%{text}명', textposition='top center')
+                        st.plotly_chart(fig6, use_container_width=True)
                 
                 else:
                     st.info("급여 정보가 없습니다.")
@@ -2361,14 +3072,17 @@ def main():
                 # 기간 선택
                 col1, col2 = st.columns(2)
                 with col1:
-                    analysis_start = st.date_input("분석 시작일", value=datetime.now().date().replace(day=1))
+                    analysis_start = st.date_input("분석 시작일", value=today.replace(day=1))
                 with col2:
-                    analysis_end = st.date_input("분석 종료일", value=datetime.now().date())
+                    analysis_end = st.date_input("분석 종료일", value=today)
                 
                 # 근태 데이터 조회
                 attendance_df = get_attendance(supabase, None, analysis_start, analysis_end)
                 
                 if not attendance_df.empty:
+                    # 상태별 건수는 한 번만 집계하여 지각률/결근률/분포 차트에 공유 (범주형 컬럼의 건수 0 범주는 제외)
+                    status_dist = attendance_df['status'].value_counts()[lambda counts: counts > 0] if 'status' in attendance_df.columns else pd.Series(dtype='int64')
+                    
                     # 근태 현황 지표
                     col1, col2, col3, col4 = st.columns(4)
                     
@@ -2383,12 +3097,12 @@ def main():
                     
                     with col3:
                         if 'status' in attendance_df.columns:
-                            late_rate = len(attendance_df[attendance_df['status'] == '지각']) / total_records * 100
+                            late_rate = status_dist.get('지각', 0) / total_records * 100
                             st.metric("지각률", f"{late_rate:.1f}%")
                     
                     with col4:
                         if 'status' in attendance_df.columns:
-                            absent_rate = len(attendance_df[attendance_df['status'] == '결근']) / total_records * 100
+                            absent_rate = status_dist.get('결근', 0) / total_records * 100
                             st.metric("결근률", f"{absent_rate:.1f}%")
                     
                     # 일별 출근율
@@ -2399,18 +3113,12 @@ def main():
                             st.plotly_chart(fig7, use_container_width=True)
                     
                     # 근태 상태별 분포
-                    if 'status' in attendance_df.columns:
-                        status_dist = attendance_df['status'].value_counts()
-                        if not status_dist.empty:
-                            fig8 = px.pie(values=status_dist.values, names=status_dist.index, title="근태 상태별 분포")
-                            st.plotly_chart(fig8, use_container_width=True)
+                    if not status_dist.empty:
+                        fig8 = build_pie_figure(status_dist.to_numpy(), status_dist.index.to_numpy(), "근태 상태별 분포")
+                        st.plotly_chart(fig8, use_container_width=True)
                     
                     # 직원별 근무시간 분석
-                    if 'employees' in attendance_df.columns and 'actual_hours' in attendance_df.columns:
-                        attendance_df['employee_name'] = attendance_df['employees'].apply(
-                            lambda x: x['name'] if isinstance(x, dict) and x else ''
-                        )
-                        
+                    if 'employee_name' in attendance_df.columns and 'actual_hours' in attendance_df.columns:
                         emp_hours = attendance_df.groupby('employee_name')['actual_hours'].agg(['sum', 'mean', 'count']).reset_index()
                         emp_hours.columns = ['employee_name', 'total_hours', 'avg_hours', 'work_days']
                         
@@ -2427,20 +3135,18 @@ def main():
             with tab4:
                 st.subheader("연차 사용 분석")
                 
-                if 'total_annual_leave' in employees_df.columns:
-                    # 연차 통계 지표
+                if has_annual_leave:
+                    # 연차 통계 지표 (부여/사용/잔여 합계를 한 번에 집계)
+                    total_granted, total_used, total_remaining = employees_df[LEAVE_TOTAL_COLUMNS].sum().tolist()
                     col1, col2, col3, col4 = st.columns(4)
                     
                     with col1:
-                        total_granted = employees_df['total_annual_leave'].sum()
                         st.metric("총 부여 연차", f"{total_granted}일")
                     
                     with col2:
-                        total_used = employees_df['used_annual_leave'].sum()
                         st.metric("총 사용 연차", f"{total_used}일")
                     
                     with col3:
-                        total_remaining = employees_df['remaining_annual_leave'].sum()
                         st.metric("총 잔여 연차", f"{total_remaining}일")
                     
                     with col4:
@@ -2448,26 +3154,15 @@ def main():
                         st.metric("전체 사용률", f"{usage_rate:.1f}%")
                     
                     # 직원별 연차 사용률
-                    emp_leave = employees_df.copy()
-                    emp_leave['usage_rate'] = (emp_leave['used_annual_leave'] / emp_leave['total_annual_leave'] * 100).fillna(0)
-                    
-                    fig10 = px.bar(emp_leave, x='name', y='usage_rate', 
-                                  title="직원별 연차 사용률 (%)",
-                                  color='usage_rate',
-                                  color_continuous_scale='RdYlGn_r')
+                    emp_usage_rate = calculate_leave_usage_rate(employees_df['used_annual_leave'], employees_df['total_annual_leave'])
+                    fig10 = build_leave_usage_rate_figure(employees_df['name'], emp_usage_rate)
                     st.plotly_chart(fig10, use_container_width=True)
                     
                     # 부서별 연차 현황
-                    if 'department' in employees_df.columns:
-                        dept_leave = employees_df.groupby('department').agg({
-                            'total_annual_leave': 'sum',
-                            'used_annual_leave': 'sum',
-                            'remaining_annual_leave': 'sum'
-                        }).reset_index()
+                    if has_department:
+                        dept_leave = get_department_stats(employees_df)
                         
-                        fig11 = px.bar(dept_leave, x='department', 
-                                      y=['used_annual_leave', 'remaining_annual_leave'],
-                                      title="부서별 연차 사용 현황")
+                        fig11 = build_dept_leave_figure(dept_leave)
                         st.plotly_chart(fig11, use_container_width=True)
         
         else:
@@ -2488,11 +3183,9 @@ def main():
             # 데이터 현황
             st.info(f"📊 등록된 직원 수: {len(employees_df)}")
             
-            attendance_df = get_attendance(supabase)
-            st.info(f"⏰ 근태 기록 수: {len(attendance_df)}")
-            
-            payroll_df = get_payroll(supabase)
-            st.info(f"💰 급여 기록 수: {len(payroll_df)}")
+            record_counts = get_record_counts(supabase)
+            st.info(f"⏰ 근태 기록 수: {record_counts['attendance']}")
+            st.info(f"💰 급여 기록 수: {record_counts['payroll']}")
             
             # 시스템 정보
             st.write("**🔧 시스템 버전**")
@@ -2616,13 +3309,14 @@ def main():
             """)
     
     # 푸터
+    record_counts = get_record_counts(supabase)
     st.markdown("---")
     st.markdown(f"""
     <div style='text-align: center; color: #666; padding: 20px;'>
         <p>💼 급여 및 인사 관리 시스템 v2.0 Complete</p>
         <p>✅ test9.py + test10.py 완전 통합 - 정확한 세금계산 + 모든 기능</p>
         <p>🔒 모든 데이터는 안전하게 암호화되어 저장됩니다</p>
-        <p>현재 데이터: 직원 {len(employees_df)}명, 근태 {len(get_attendance(supabase))}건, 급여 {len(get_payroll(supabase))}건</p>
+        <p>현재 데이터: 직원 {len(employees_df)}명, 근태 {record_counts['attendance']}건, 급여 {record_counts['payroll']}건</p>
         <p style='margin-top: 10px; font-size: 12px; color: #999;'>
             🎯 정확한 세금 계산 + 완전한 기능으로 실제 급여와 일치합니다!
         </p>
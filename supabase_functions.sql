@@ -0,0 +1,88 @@
+-- ============================================
+-- 급여관리 시스템 Supabase(PostgreSQL) 함수
+-- Supabase SQL Editor에서 실행
+-- ============================================
+
+-- 근태 기록 추가 및 연차 자동 차감 (단일 트랜잭션)
+CREATE OR REPLACE FUNCTION attendance_insert_with_leave(
+    p_employee_id integer,
+    p_date date,
+    p_clock_in time,
+    p_clock_out time,
+    p_actual_hours numeric,
+    p_status text,
+    p_notes text DEFAULT NULL
+) RETURNS json AS $$
+DECLARE
+    v_attendance attendance;
+BEGIN
+    INSERT INTO attendance (employee_id, date, clock_in, clock_out, actual_hours, status, notes)
+    VALUES (p_employee_id, p_date, p_clock_in, p_clock_out, p_actual_hours, p_status, p_notes)
+    RETURNING * INTO v_attendance;
+
+    IF p_status = '연차' THEN
+        UPDATE employees
+        SET used_annual_leave = COALESCE(used_annual_leave, 0) + 1,
+            remaining_annual_leave = GREATEST(0, COALESCE(remaining_annual_leave, 0) - 1),
+            updated_at = now()
+        WHERE id = p_employee_id;
+    END IF;
+
+    RETURN row_to_json(v_attendance);
+END;
+$$ LANGUAGE plpgsql;
+
+-- 급여 upsert(on_conflict = employee_id, pay_month)용 유니크 인덱스
+CREATE UNIQUE INDEX IF NOT EXISTS payroll_employee_id_pay_month_key
+    ON payroll (employee_id, pay_month);
+
+-- 급여 upsert는 created_at을 보내지 않으므로 (재계산 시 최초 생성일 유지) 신규 행은 DB 기본값으로 생성일 기록
+ALTER TABLE payroll ADD COLUMN IF NOT EXISTS created_at timestamptz;
+ALTER TABLE payroll ALTER COLUMN created_at SET DEFAULT now();
+
+-- 기간 내 직원별 근태 집계 (무급휴가 일수, 지각/조퇴 차감 시간)
+-- 지각: 09:00 기준 30분 이상 늦은 경우 지각 시간 전체, 조퇴: 8시간 미만 근무 시간
+CREATE OR REPLACE FUNCTION monthly_attendance_summary(
+    p_start_date date,
+    p_end_date date
+) RETURNS TABLE (employee_id integer, unpaid_days integer, late_hours numeric) AS $$
+    SELECT
+        a.employee_id,
+        COUNT(*) FILTER (WHERE a.status = '무급휴가')::integer AS unpaid_days,
+        COALESCE(SUM(
+            CASE
+                WHEN a.status = '지각'
+                     AND EXTRACT(HOUR FROM a.clock_in) * 60 + EXTRACT(MINUTE FROM a.clock_in) - 540 >= 30
+                    THEN (EXTRACT(HOUR FROM a.clock_in) * 60 + EXTRACT(MINUTE FROM a.clock_in) - 540) / 60.0
+                WHEN a.status = '조퇴' AND COALESCE(a.actual_hours, 0) < 8
+                    THEN 8 - COALESCE(a.actual_hours, 0)
+                ELSE 0
+            END
+        ), 0) AS late_hours
+    FROM attendance a
+    WHERE a.date BETWEEN p_start_date AND p_end_date
+    GROUP BY a.employee_id;
+$$ LANGUAGE sql STABLE;
+
+-- 월별 급여 지급 합계 (통계 화면용, 급여 전체를 내려받지 않고 월 단위 집계만 조회)
+CREATE OR REPLACE VIEW monthly_payroll_totals AS
+SELECT
+    pay_month,
+    COALESCE(SUM(net_pay), 0)::bigint AS total_pay,
+    COUNT(employee_id)::integer AS employee_count
+FROM payroll
+GROUP BY pay_month;
+
+-- 직원 연차 일괄 수정 (id별 총 연차/수정 시각만 UPDATE, 존재하지 않는 id는 무시), 수정된 행 수 반환
+CREATE OR REPLACE FUNCTION employees_update_annual_leave_bulk(p_rows json)
+RETURNS integer AS $$
+    WITH updated AS (
+        UPDATE employees e
+        SET total_annual_leave = r.total_annual_leave,
+            updated_at = r.updated_at
+        FROM json_to_recordset(p_rows) AS r(id integer, total_annual_leave integer, updated_at timestamptz)
+        WHERE e.id = r.id
+        RETURNING e.id
+    )
+    SELECT COUNT(*)::integer FROM updated;
+$$ LANGUAGE sql;